@@ -0,0 +1,184 @@
+"""
+Bulk Neighborhood Analysis Store
+Buffers neighborhood_analysis rows and upserts them in batches via the
+upsert_neighborhood_analysis_bulk RPC
+(sql/migrations/20261016_upsert_neighborhood_analysis_bulk.sql) instead of
+one upsert_neighborhood_analysis POST per property.
+
+- AnalysisWriter.add() queues a row; the buffer is sent once it holds
+  batch_size rows or its oldest row has waited flush_seconds (checked as rows
+  are added), and on flush() / leaving the with block
+- Requests go through http_client (shared keep-alive session, per-host
+  limits, retries)
+- Failures are reported per row: AnalysisWriter.failed maps property_id to
+  the error message
+- Safe to share across the batch engine's worker threads
+
+Used by neighborhood_enrichment.py and osm_access_analyzer.py.
+
+Usage:
+    from analysis_store import AnalysisWriter, build_analysis_row
+    with AnalysisWriter(SUPABASE_URL, SUPABASE_KEY) as writer:
+        writer.add(build_analysis_row(property_id, access_data=access_data))
+    print(writer.stored, writer.failed)
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+
+# Add scripts directory to path to import shared modules
+sys.path.insert(0, str(Path(__file__).parent))
+from http_client import http_request
+
+# Analyses sent per upsert_neighborhood_analysis_bulk request
+DEFAULT_BATCH_SIZE = 100
+
+# A partly filled buffer is sent once its oldest row has waited this long
+DEFAULT_FLUSH_SECONDS = 10.0
+
+METERS_TO_FEET = 3.28084
+
+
+def build_analysis_row(
+    property_id: str,
+    crime_stats: Optional[Dict] = None,
+    demographics: Optional[Dict] = None,
+    access_data: Optional[Dict] = None,
+    amenity_distances: Optional[Dict] = None,
+    school_ratings: Optional[Dict] = None,
+    scores: Optional[Dict] = None,
+    data_completeness: Optional[float] = None
+) -> Dict:
+    """
+    Map analysis results to the JSON shape upsert_neighborhood_analysis_bulk
+    expects. Sections left as None keep their stored values.
+    """
+    scores = scores or {}
+
+    # Convert distance from meters to feet if present
+    distance_to_public_road_ft = None
+    if access_data and access_data.get('distance_to_public_road'):
+        distance_to_public_road_ft = round(access_data['distance_to_public_road'] * METERS_TO_FEET, 2)
+
+    # Build road access data
+    road_access_data = None
+    if access_data:
+        road_access_data = {
+            'distance_to_public_road': access_data.get('distance_to_public_road'),
+            'nearest_road_name': access_data.get('nearest_road_name'),
+            'nearest_road_point': access_data.get('nearest_road_point'),
+            'nearest_road_bearing': access_data.get('nearest_road_bearing'),
+            'road_types_nearby': access_data.get('road_types_nearby', [])
+        }
+
+    return {
+        'property_id': property_id,
+        'crime_statistics': crime_stats,
+        'crime_data_source': 'fbi_ucr' if crime_stats else None,
+        'demographics': demographics,
+        'demographics_source': 'census_acs' if demographics else None,
+        'landlocked_status': access_data.get('landlocked') if access_data else None,
+        'road_access_type': access_data.get('road_access_type') if access_data else None,
+        'distance_to_public_road_ft': distance_to_public_road_ft,
+        'access_notes': f"Analysis via OpenStreetMap. Road access data: {road_access_data}" if road_access_data else None,
+        'school_ratings': school_ratings,
+        'school_data_source': None,  # Placeholder for future integration
+        'amenity_distances': amenity_distances,
+        'amenity_data_source': 'osm' if amenity_distances else None,
+        'neighborhood_score': scores.get('neighborhood_score'),
+        'safety_score': scores.get('safety_score'),
+        'walkability_score': scores.get('walkability_score'),
+        'school_score': scores.get('school_score'),
+        'access_score': scores.get('access_score'),
+        'data_completeness': data_completeness,
+        'analysis_confidence': data_completeness,  # Use completeness as confidence proxy
+    }
+
+
+def upsert_analyses_bulk(supabase_url: str, supabase_key: str, rows: List[Dict]) -> Dict[str, Optional[str]]:
+    """
+    Upsert one batch of analysis rows in a single RPC.
+
+    Returns:
+        property_id -> error message, None for rows that were stored. If the
+        request itself fails every row gets its error.
+    """
+    headers = {
+        "Authorization": f"Bearer {supabase_key}",
+        "apikey": supabase_key,
+        "Content-Type": "application/json",
+    }
+    rpc_url = f"{supabase_url}/rest/v1/rpc/upsert_neighborhood_analysis_bulk"
+
+    try:
+        response = http_request('POST', rpc_url, headers=headers, json={'p_analyses': rows}, timeout=60)
+        response.raise_for_status()
+        results = response.json() or []
+    except (requests.RequestException, ValueError) as e:
+        return {row['property_id']: str(e) for row in rows}
+
+    errors = {row['property_id']: "No result returned for row" for row in rows}
+    for result in results:
+        errors[rows[result['row_index']]['property_id']] = result.get('error_message')
+    return errors
+
+
+class AnalysisWriter:
+    """Buffered, thread-safe writer of neighborhood_analysis rows"""
+
+    def __init__(self, supabase_url: str, supabase_key: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_seconds: float = DEFAULT_FLUSH_SECONDS):
+        self.supabase_url = supabase_url
+        self.supabase_key = supabase_key
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.stored = 0
+        self.failed: Dict[str, str] = {}
+        self._buffer: List[Dict] = []
+        self._oldest: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def add(self, row: Dict) -> None:
+        """Queue a row from build_analysis_row, sending the buffer if it is due"""
+        with self._lock:
+            if not self._buffer:
+                self._oldest = time.monotonic()
+            self._buffer.append(row)
+            due = (len(self._buffer) >= self.batch_size
+                   or time.monotonic() - self._oldest >= self.flush_seconds)
+            batch = self._take() if due else None
+        if batch:
+            self._send(batch)
+
+    def flush(self) -> Dict[str, Optional[str]]:
+        """Send whatever is buffered; returns property_id -> error (None if stored)"""
+        with self._lock:
+            batch = self._take()
+        return self._send(batch) if batch else {}
+
+    def _take(self) -> List[Dict]:
+        batch, self._buffer, self._oldest = self._buffer, [], None
+        return batch
+
+    def _send(self, batch: List[Dict]) -> Dict[str, Optional[str]]:
+        # Sent outside the lock, so other threads keep queueing meanwhile
+        errors = upsert_analyses_bulk(self.supabase_url, self.supabase_key, batch)
+        with self._lock:
+            for property_id, error in errors.items():
+                if error:
+                    self.failed[property_id] = error
+                else:
+                    self.stored += 1
+                    self.failed.pop(property_id, None)
+        return errors
+
+    def __enter__(self) -> "AnalysisWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.flush()
@@ -0,0 +1,121 @@
+"""
+API Response Cache
+TTL-bound memo for slow, rarely changing API lookups (state crime statistics,
+Census data): an in-process dict in front of a SQLite table, so a batch makes
+each distinct request once and later runs reuse it until it expires.
+
+- Values are JSON; each namespace has its own TTL
+- Misses (None) are remembered in-process for NEGATIVE_TTL_SECONDS only, so a
+  failing API is not retried for every property but is retried next run
+- Safe to share across threads; concurrent misses for a key fetch once
+
+Usage:
+    from api_cache import ApiCache
+    crime_cache = ApiCache("fbi_crime", ttl_seconds=7 * 24 * 3600)
+    stats = crime_cache.get_or_fetch("PA:2021-2025", lambda: request_stats("PA"))
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+API_CACHE_PATH = Path(os.getenv("API_CACHE_PATH", str(Path(__file__).parent / ".cache" / "api_cache.sqlite")))
+NEGATIVE_TTL_SECONDS = 300
+
+_MISSING = object()
+
+
+class ApiCache:
+    """TTL cache for one API namespace: in-process memo backed by SQLite"""
+
+    _connections: Dict[Path, sqlite3.Connection] = {}
+    _connections_lock = threading.Lock()
+
+    def __init__(self, namespace: str, ttl_seconds: int, path: Path = API_CACHE_PATH):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.path = Path(path)
+        self._memory: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    def _db(self) -> sqlite3.Connection:
+        with ApiCache._connections_lock:
+            conn = ApiCache._connections.get(self.path)
+            if conn is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS api_cache ("
+                    " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+                    " expires_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+                )
+                ApiCache._connections[self.path] = conn
+            return conn
+
+    def get(self, key: str) -> Any:
+        """Cached value, or None if absent or expired"""
+        value = self._lookup(key)
+        return None if value is _MISSING else value
+
+    def _lookup(self, key: str) -> Any:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+
+            row = self._db().execute(
+                "SELECT value, expires_at FROM api_cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+            if row and row[1] > now:
+                value = json.loads(row[0])
+                self._memory[key] = (row[1], value)
+                return value
+        return _MISSING
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        """Store a value; None is only remembered in-process for NEGATIVE_TTL_SECONDS"""
+        now = time.time()
+        with self._lock:
+            if value is None:
+                self._memory[key] = (now + NEGATIVE_TTL_SECONDS, None)
+                return
+            expires_at = now + (ttl_seconds or self.ttl_seconds)
+            self._memory[key] = (expires_at, value)
+            self._db().execute(
+                "INSERT OR REPLACE INTO api_cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value), expires_at)
+            )
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Cached value for key, calling fetch() (and caching its result) on a
+        miss. Concurrent misses for one key wait for a single fetch.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                value = fetch()
+                self.set(key, value)
+            return value
+
+    def purge_expired(self) -> int:
+        """Delete this namespace's expired rows; returns how many were removed"""
+        with self._lock:
+            cursor = self._db().execute(
+                "DELETE FROM api_cache WHERE namespace = ? AND expires_at <= ?", (self.namespace, time.time())
+            )
+            return cursor.rowcount
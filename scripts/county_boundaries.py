@@ -0,0 +1,77 @@
+"""
+County Boundaries
+Local point-in-polygon county lookup (state FIPS, county FIPS, name) from a
+Census TIGER/Line or cartographic boundary county shapefile, so demographics
+need no geocoder call per property.
+
+The shapefile is not in the repository; download it once into scripts/data/tiger:
+
+    curl -O https://www2.census.gov/geo/tiger/GENZ2023/shp/cb_2023_us_county_500k.zip
+    unzip cb_2023_us_county_500k.zip -d scripts/data/tiger
+
+Requires pyshp and shapely (optional dependencies; `pip install pyshp shapely`).
+Without them, or without the shapefile, lookups return None and callers fall
+back to the Census geocoder.
+
+Usage:
+    from county_boundaries import lookup_county
+    lookup_county(40.5186, -78.3947)   # ('42', '013', 'Blair County')
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+
+try:
+    import shapefile
+    import shapely
+except ImportError:  # Optional dependencies - local lookups are unavailable without them
+    shapefile = None
+
+COUNTY_SHAPEFILE = Path(os.getenv(
+    "COUNTY_SHAPEFILE",
+    str(Path(__file__).parent / "data" / "tiger" / "cb_2023_us_county_500k.shp")
+))
+
+
+class CountyBoundaries:
+    """County polygons from a TIGER county shapefile in an STRtree"""
+
+    def __init__(self, path: Path = COUNTY_SHAPEFILE):
+        if shapefile is None:
+            raise ImportError("County boundaries require pyshp and shapely (pip install pyshp shapely)")
+
+        with shapefile.Reader(str(path)) as reader:
+            fields = [field[0] for field in reader.fields[1:]]
+            name_field = 'NAMELSAD' if 'NAMELSAD' in fields else 'NAME'
+            self.counties = []
+            polygons = []
+            for shape_record in reader.iterShapeRecords():
+                record = shape_record.record.as_dict()
+                self.counties.append((record['STATEFP'], record['COUNTYFP'], record[name_field]))
+                polygons.append(shapely.geometry.shape(shape_record.shape.__geo_interface__))
+
+        self.polygons = polygons
+        self.tree = shapely.STRtree(polygons)
+
+    def lookup(self, latitude: float, longitude: float) -> Optional[Tuple[str, str, str]]:
+        """(state FIPS, county FIPS, county name) of the county containing the point"""
+        matches = self.tree.query(shapely.points(longitude, latitude), predicate='intersects')
+        if not len(matches):
+            return None
+        return self.counties[int(min(matches))]
+
+
+@lru_cache(maxsize=1)
+def load_county_boundaries(path: Path = COUNTY_SHAPEFILE) -> Optional[CountyBoundaries]:
+    """The county boundaries, loaded once per process (None if unavailable)"""
+    if shapefile is None or not Path(path).exists():
+        return None
+    return CountyBoundaries(path)
+
+
+def lookup_county(latitude: float, longitude: float) -> Optional[Tuple[str, str, str]]:
+    """(state FIPS, county FIPS, county name) for a point, or None if not answerable locally"""
+    boundaries = load_county_boundaries()
+    return boundaries.lookup(latitude, longitude) if boundaries else None
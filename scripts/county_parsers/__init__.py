@@ -0,0 +1,119 @@
+"""
+County Parser Plugins
+Registry of the counties whose property lists need more than universal_parser's
+format detection and row parsers.
+
+A plugin is a CountyParser subclass in this package, registered with
+@register. It supplies only what differs for its county - row hooks, a layout
+profile, known sale documents - and universal_parser runs everything else
+(download cache, parse cache, OCR, bulk store, job tracking, metrics).
+Hooks left as None fall back to universal_parser's defaults, so counties
+without a plugin use the base CountyParser unchanged.
+
+Usage:
+    plugin = get_county_parser('Blair', 'PA')
+    python universal_parser.py --county "Blair" --state "PA"   # uses the plugin
+
+Adding a county: create county_parsers/<county>.py with
+
+    @register
+    class CentreParser(CountyParser):
+        county_name = 'Centre'
+        state_code = 'PA'
+
+        def parse_row(self, row, pdf_format, state_code, municipality=None):
+            ...
+"""
+
+import importlib
+import pkgutil
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Add scripts directory to path to import shared modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from parse_cache import source_fingerprint
+
+
+class CountyParser:
+    """
+    Base plugin. Row hooks are plain methods on subclasses:
+
+        detect_format(first_row, page_text) -> 'repository' | 'judicial' | 'upset' | 'unknown'
+        municipality(row) -> municipality name if row is a municipality header
+        skip_row(row) -> True for header rows that are not properties
+        parse_row(row, pdf_format, state_code, municipality) -> property dict or None
+        parse_parcel_id(text, state_code) -> parcel ID in a text line (text fallback)
+    """
+
+    county_name: Optional[str] = None
+    state_code: Optional[str] = None
+
+    parser_name = 'universal_parser'  # Recorded as parsing_jobs.parser_used
+    tax_year: Optional[int] = None    # None = current year
+    min_row_cells = 3                 # Shorter table rows are skipped
+    text_line_confidence = 0.50       # Parcel-only properties from the text fallback
+
+    # Known sale documents: {"title", "url", "sale_type", "sale_date"}; title
+    # matches the documents table (case-insensitive substring)
+    documents: List[Dict] = []
+
+    # Row hooks (None = universal_parser default)
+    detect_format = None
+    municipality = None
+    skip_row = None
+    parse_row = None
+    parse_parcel_id = None
+
+    def layout_profile(self, sale_type: Optional[str]) -> Optional[Dict]:
+        """Layout profile to start from instead of learning one (see layout_profile.py)"""
+        return None
+
+    def fallback_properties(self, sale_type: Optional[str], sale_date: Optional[str]) -> List[Dict]:
+        """Properties to store when parsing a document finds none"""
+        return []
+
+    def document_info(self, title: str) -> Dict:
+        """The known document whose title matches, or {}"""
+        title = (title or '').lower()
+        return next((doc for doc in self.documents if doc['title'].lower() in title), {})
+
+    def cache_tag(self) -> str:
+        """Parse cache key part, so editing a plugin invalidates its cached parses"""
+        if type(self) is CountyParser:
+            return "universal"
+        source = sys.modules[type(self).__module__].__file__
+        return f"{type(self).__name__}-{source_fingerprint(__file__, source)}"
+
+
+COUNTY_PARSERS: Dict[Tuple[str, str], type] = {}
+_plugins_loaded = False
+
+
+def register(cls: type) -> type:
+    """Class decorator adding a CountyParser subclass to the registry"""
+    COUNTY_PARSERS[(cls.state_code.upper(), cls.county_name.upper())] = cls
+    return cls
+
+
+def load_plugins() -> None:
+    """Import every module in this package so their @register calls run"""
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    for module in pkgutil.iter_modules(__path__):
+        importlib.import_module(f"{__name__}.{module.name}")
+    _plugins_loaded = True
+
+
+def get_county_parser(county_name: str, state_code: str) -> CountyParser:
+    """The county's plugin, or the base CountyParser (universal behaviour)"""
+    load_plugins()
+    cls = COUNTY_PARSERS.get((state_code.upper(), county_name.upper()), CountyParser)
+    return cls()
+
+
+def list_county_parsers() -> List[CountyParser]:
+    load_plugins()
+    return [cls() for _, cls in sorted(COUNTY_PARSERS.items())]
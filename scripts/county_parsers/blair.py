@@ -0,0 +1,258 @@
+"""
+Blair County, PA
+Repository, judicial and upset sale lists from blairco.org. All three are ruled
+tables that pdfplumber's default settings extract; the columns differ per sale
+type (see the row parsers).
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from county_parsers import CountyParser, register
+from text_normalize import clean_spaced_address, clean_spaced_text, parse_money
+
+# Map Number format: "01.05-16..-093.00-000" (also extracted spaced out: "0 1 . 05-16..-093.00-000")
+BLAIR_PARCEL_RE = re.compile(r'\d{2}\.\d{2}-\d{2}\.+-\d{3}\.\d{2}-\d{3}')
+# Alternative format: XX-XXX-XXX.X or XX-XXX-XXX
+ALT_PARCEL_RE = re.compile(r'\d{2,3}-\d{2,3}-\d{3,4}\.?\d?')
+
+CAMA_NUM_RE = re.compile(r'^\d{7,8}$')
+CONTROL_NUM_RE = re.compile(r'^\d{3}-\d{6}$')
+MUNICIPALITY_NAME_RE = re.compile(r'^[A-Z\s]+$')
+
+PARCEL_REJECT_WORDS = ['TOWNSHIP', 'BOROUGH', 'CITY OF', 'CAMA', 'MAP NUMBER']
+HEADER_PATTERNS = [
+    'TOWNSHIP', 'BOROUGH', 'CITY OF', 'CAMA #', 'CAMA#',
+    'REPUTED OWNER', 'PROPERTY DESC', 'MAP NUMBER', 'LAND USE'
+]
+
+
+@register
+class BlairParser(CountyParser):
+    county_name = 'Blair'
+    state_code = 'PA'
+    parser_name = 'pdfplumber'
+    tax_year = 2025
+    min_row_cells = 4
+    text_line_confidence = 0.60
+
+    documents = [
+        {
+            "title": "Repository Property List",
+            "url": "https://www.blairco.org/getmedia/1f3bb36c-bd33-4b51-b9cf-f25a43fa7a8e/REPOSITORY_LIST.pdf",
+            "sale_type": "repository",
+            "sale_date": "2026-03-11 10:00:00"
+        },
+        {
+            "title": "Judicial Sale Property List",
+            "url": "https://www.blairco.org/getmedia/03050d22-2704-4bcb-bdaa-388d1a80e181/Judicial-Sale-List.pdf",
+            "sale_type": "judicial",
+            "sale_date": "2026-04-15 10:00:00"
+        },
+        {
+            "title": "Upset Sale Property List",
+            "url": "https://blairco.org/getmedia/05b601bf-4372-4526-8ac2-82ad45322e93/Upset-Sale-List.pdf",
+            "sale_type": "upset",
+            "sale_date": "2025-09-17 09:00:00"
+        }
+    ]
+
+    def layout_profile(self, sale_type: Optional[str]) -> Optional[Dict]:
+        """Each sale type has one format, in a ruled table pdfplumber finds with its defaults"""
+        if sale_type not in ('repository', 'judicial', 'upset'):
+            return None
+        return {
+            'format': sale_type,
+            'table_settings': {},
+            'table_bbox': None,
+            'column_edges': [],
+            'header_row': None,
+            'header_bbox': None,
+            'page_size': None,
+        }
+
+    def parse_parcel_id(self, value: str, state_code: str = 'PA') -> Optional[str]:
+        """Extract and validate parcel ID from Blair County Map Number format"""
+        if not value:
+            return None
+
+        clean_value = str(value).strip()
+
+        # Reject township/borough/city names (these are NOT parcel IDs)
+        upper_value = clean_value.upper()
+        if any(x in upper_value for x in PARCEL_REJECT_WORDS):
+            return None
+
+        # Remove extra spaces in the parcel ID
+        clean_value = re.sub(r'\s+', '', clean_value)
+
+        match = BLAIR_PARCEL_RE.search(clean_value) or ALT_PARCEL_RE.search(clean_value)
+        return match.group(0) if match else None
+
+    def detect_format(self, first_row: list, page_text: str = "") -> str:
+        """Detect the PDF format based on header row"""
+        if not first_row:
+            return "unknown"
+
+        header_text = ' '.join([str(c).upper() if c else '' for c in first_row])
+
+        if 'CAMA' in header_text and 'REPUTED OWNER' in header_text:
+            return "repository"  # Repository format: CAMA#, Owner, Address, Map Number, Land Use
+        elif 'WINNING BID' in header_text:
+            return "judicial"  # Judicial format: *, Control#, Owner, Map#, Desc, Land Use, Bid, Bidder
+        elif 'UPSET' in header_text or 'APPROXIMATE' in header_text:
+            return "upset"  # Upset sale format: Control#, Owner, Map#, Desc, Upset Amount
+        elif 'CONTROL NO' in header_text:
+            return "upset"  # Upset sale also has CONTROL NO header
+        else:
+            return "unknown"
+
+    def municipality(self, row: list) -> Optional[str]:
+        first_cell = str(row[0]).strip() if row[0] else ""
+        upper = first_cell.upper()
+        if 'TOWNSHIP' in upper or 'BOROUGH' in upper or 'CITY OF' in upper:
+            return first_cell
+        return None
+
+    def skip_row(self, row: list) -> bool:
+        """Check if row is a township/municipality header (not a property)"""
+        if not row or len(row) < 2:
+            return False
+
+        first_cell = str(row[0]).strip().upper() if row[0] else ""
+
+        for pattern in HEADER_PATTERNS:
+            if pattern in first_cell:
+                return True
+
+        # Also skip if first cell doesn't look like a CAMA number and looks
+        # like a municipality name (all caps, no digits)
+        if not CAMA_NUM_RE.match(first_cell):
+            if MUNICIPALITY_NAME_RE.match(first_cell) and len(first_cell) > 5:
+                return True
+
+        return False
+
+    def parse_row(self, row: list, pdf_format: Optional[str], state_code: str,
+                  municipality: str = None) -> Optional[Dict]:
+        if pdf_format == "repository":
+            return self.parse_repository_row(row, municipality)
+        elif pdf_format == "judicial":
+            return self.parse_judicial_row(row)
+        elif pdf_format == "upset":
+            return self.parse_upset_row(row, municipality)
+
+        # Unknown format: an empty or * first column is the judicial layout
+        first_col = str(row[0]).strip() if row[0] else ""
+        if first_col == "" or first_col == "*":
+            return self.parse_judicial_row(row)
+        return self.parse_repository_row(row, municipality)
+
+    def parse_repository_row(self, row: list, current_municipality: str) -> Optional[Dict]:
+        """Parse a row from Repository format PDF"""
+        # Format: CAMA#(0), Owner(1), Address(2), Map Number(3), Land Use(4)
+        if len(row) < 4:
+            return None
+
+        cama_num = str(row[0]).strip() if row[0] else ""
+        owner = str(row[1]).strip() if row[1] else None
+        address = str(row[2]).strip() if row[2] else None
+        map_number = str(row[3]).strip() if row[3] else ""
+
+        # Validate CAMA number (should be 7-8 digits)
+        if not CAMA_NUM_RE.match(cama_num):
+            return None
+
+        parcel_id = self.parse_parcel_id(map_number)
+        if not parcel_id:
+            return None
+
+        return {
+            'parcel_id': parcel_id,
+            'address': address,
+            'owner': owner,
+            'city': current_municipality,
+            'total_due': None,
+            'confidence': 0.95
+        }
+
+    def parse_judicial_row(self, row: list) -> Optional[Dict]:
+        """Parse a row from Judicial Sale format PDF"""
+        # Format: *(0), Control#(1), Owner(2), Map#(3), Desc(4), Land Use(5), Winning Bid(6), Winner(7)
+        if len(row) < 5:
+            return None
+
+        control_num = str(row[1]).strip() if len(row) > 1 and row[1] else ""
+        owner = str(row[2]).strip() if len(row) > 2 and row[2] else None
+        map_number = str(row[3]).strip() if len(row) > 3 and row[3] else ""
+        address = str(row[4]).strip() if len(row) > 4 and row[4] else None
+        winning_bid = str(row[6]).strip() if len(row) > 6 and row[6] else None
+
+        # Clean up owner name (fix spaced-out text like "B A R N ER")
+        if owner:
+            owner = clean_spaced_text(owner)
+
+        # Clean up address (fix spaced-out numbers like "8 1 5 3RD AVE")
+        if address:
+            address = clean_spaced_address(address)
+
+        # Validate control number format (XXX-XXXXXX)
+        if not CONTROL_NUM_RE.match(control_num):
+            return None
+
+        parcel_id = self.parse_parcel_id(map_number)
+        if not parcel_id:
+            return None
+
+        # Parse winning bid amount
+        total_due = None
+        if winning_bid and winning_bid != 'Not Sold':
+            total_due = parse_money(winning_bid)
+
+        return {
+            'parcel_id': parcel_id,
+            'address': address,
+            'owner': owner,
+            'city': None,
+            'total_due': total_due,
+            'confidence': 0.95
+        }
+
+    def parse_upset_row(self, row: list, current_municipality: str) -> Optional[Dict]:
+        """Parse a row from Upset Sale format PDF"""
+        # Format: Empty(0), Control#(1), Owner(2), Map#(3), Description(4), Upset Amount(5)
+        if len(row) < 6:
+            return None
+
+        control_num = str(row[1]).strip() if len(row) > 1 and row[1] else ""
+        owner = str(row[2]).strip() if len(row) > 2 and row[2] else None
+        map_number = str(row[3]).strip() if len(row) > 3 and row[3] else ""
+        address = str(row[4]).strip() if len(row) > 4 and row[4] else None
+        upset_amount = str(row[5]).strip() if len(row) > 5 and row[5] else None
+
+        # Clean up owner name (fix spaced-out text like "B A C K M EIER")
+        if owner:
+            owner = clean_spaced_text(owner)
+
+        # Clean up address (fix spaced-out numbers like "5 1 1 5TH AVE")
+        if address:
+            address = clean_spaced_address(address)
+
+        # Validate control number format (XXX-XXXXXX)
+        if not CONTROL_NUM_RE.match(control_num):
+            return None
+
+        parcel_id = self.parse_parcel_id(map_number)
+        if not parcel_id:
+            return None
+
+        total_due = parse_money(upset_amount) if upset_amount else None
+
+        return {
+            'parcel_id': parcel_id,
+            'address': address,
+            'owner': owner,
+            'city': current_municipality,
+            'total_due': total_due,
+            'confidence': 0.95
+        }
@@ -0,0 +1,125 @@
+"""
+Geodesic Helpers
+Great-circle (haversine) distances, vectorized with NumPy so one call measures
+from an origin to N points, or from M origins to N points, instead of a Python
+loop per point.
+
+Usage:
+    from geo import haversine_distance, haversine_distances, haversine_matrix
+    haversine_distance(40.51, -78.39, 40.52, -78.40)               # meters
+    haversine_distances(40.51, -78.39, lats, lons)                 # shape (N,)
+    haversine_matrix(origin_lats, origin_lons, lats, lons)         # shape (M, N)
+    index, meters = nearest(40.51, -78.39, lats, lons)
+    lines, meters, near_lats, near_lons, bearings = nearest_on_polylines(40.51, -78.39, lats, lons, line_ids)
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_METERS = 6371000
+
+
+def haversine_distances(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Great-circle distance in meters between points, broadcasting like NumPy:
+    a scalar origin against arrays of points gives one distance per point.
+    """
+    phi1 = np.radians(np.asarray(lat1, dtype=float))
+    phi2 = np.radians(np.asarray(lat2, dtype=float))
+    delta_phi = phi2 - phi1
+    delta_lambda = np.radians(np.asarray(lon2, dtype=float) - np.asarray(lon1, dtype=float))
+
+    a = np.sin(delta_phi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in meters between two points"""
+    return float(haversine_distances(lat1, lon1, lat2, lon2))
+
+
+def haversine_matrix(lats1, lons1, lats2, lons2) -> np.ndarray:
+    """Distances in meters from each of M origins (rows) to each of N points (columns)"""
+    lats1 = np.asarray(lats1, dtype=float)[:, np.newaxis]
+    lons1 = np.asarray(lons1, dtype=float)[:, np.newaxis]
+    return haversine_distances(lats1, lons1, np.asarray(lats2, dtype=float), np.asarray(lons2, dtype=float))
+
+
+def nearest(latitude: float, longitude: float, lats, lons,
+            max_meters: Optional[float] = None) -> Tuple[Optional[int], Optional[float]]:
+    """Index of and distance to the point nearest the origin (None, None if none within max_meters)"""
+    if len(lats) == 0:
+        return None, None
+    distances = haversine_distances(latitude, longitude, lats, lons)
+    index = int(np.argmin(distances))
+    if max_meters is not None and distances[index] > max_meters:
+        return None, None
+    return index, float(distances[index])
+
+
+def segment_bearings(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Initial great-circle bearing in degrees (0 = north, clockwise) from each start to its end"""
+    phi1 = np.radians(np.asarray(lat1, dtype=float))
+    phi2 = np.radians(np.asarray(lat2, dtype=float))
+    delta_lambda = np.radians(np.asarray(lon2, dtype=float) - np.asarray(lon1, dtype=float))
+
+    y = np.sin(delta_lambda) * np.cos(phi2)
+    x = np.cos(phi1) * np.sin(phi2) - np.sin(phi1) * np.cos(phi2) * np.cos(delta_lambda)
+    return np.degrees(np.arctan2(y, x)) % 360
+
+
+def nearest_on_polylines(latitude: float, longitude: float, lats, lons, line_ids) -> Tuple[np.ndarray, ...]:
+    """
+    Nearest point on each polyline (e.g. each road) to an origin, over every
+    segment of every line in one pass.
+
+    lats/lons are the lines' vertices in order, line_ids the line each
+    vertex belongs to (a line's vertices contiguous). A one-vertex line is
+    measured to that vertex. The origin is projected onto each segment in an
+    equirectangular plane around it (exact enough within a few kilometres);
+    the distance to the projected point is great-circle.
+
+    Returns:
+        Tuple of arrays, one entry per line in ascending line id:
+        (line ids, meters, nearest point lats, nearest point lons, segment bearings)
+        Bearings are NaN for one-vertex lines.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    line_ids = np.asarray(line_ids)
+    if len(lats) == 0:
+        empty = np.empty(0)
+        return line_ids[:0], empty, empty, empty, empty
+
+    # Segments join consecutive vertices of the same line; one-vertex lines
+    # become a zero-length segment
+    starts = np.nonzero(line_ids[:-1] == line_ids[1:])[0]
+    ends = starts + 1
+    _, first, counts = np.unique(line_ids, return_index=True, return_counts=True)
+    single = first[counts == 1]
+    starts = np.concatenate([starts, single])
+    ends = np.concatenate([ends, single])
+
+    # Project the origin onto each segment (degrees, longitude scaled by cos(latitude))
+    x_scale = np.cos(np.radians(latitude))
+    ax = (lons[starts] - longitude) * x_scale
+    ay = lats[starts] - latitude
+    dx = (lons[ends] - lons[starts]) * x_scale
+    dy = lats[ends] - lats[starts]
+    length_sq = dx * dx + dy * dy
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = np.where(length_sq > 0, -(ax * dx + ay * dy) / length_sq, 0.0)
+    t = np.clip(t, 0.0, 1.0)
+
+    near_lats = lats[starts] + t * (lats[ends] - lats[starts])
+    near_lons = lons[starts] + t * (lons[ends] - lons[starts])
+    distances = haversine_distances(latitude, longitude, near_lats, near_lons)
+    bearings = np.where(length_sq > 0,
+                        segment_bearings(lats[starts], lons[starts], lats[ends], lons[ends]), np.nan)
+
+    # Nearest segment of each line: sort by (line, distance), keep each line's first
+    segment_lines = line_ids[starts]
+    order = np.lexsort((distances, segment_lines))
+    keep = order[np.concatenate([[True], segment_lines[order][1:] != segment_lines[order][:-1]])]
+    return segment_lines[keep], distances[keep], near_lats[keep], near_lons[keep], bearings[keep]
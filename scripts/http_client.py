@@ -0,0 +1,161 @@
+"""
+Shared HTTP Client
+One pooled keep-alive requests.Session for every Supabase and public API call
+in scripts/, so short calls reuse an open TLS connection instead of paying a
+TCP + TLS handshake each time.
+
+- Default (connect, read) timeouts unless a call passes its own
+- Per-host concurrency and rate limits from rate_limiter.py
+- 429 and 5xx responses and connection errors are retried with exponential
+  backoff plus jitter, honouring Retry-After
+- Every attempt's latency is recorded per host; latency_summary() and
+  print_latency_summary() report calls, retries, errors and percentiles
+
+requests speaks HTTP/1.1 only (no HTTP/2); keep-alive is what removes the
+repeated handshakes.
+
+Usage:
+    from http_client import http_request, print_latency_summary
+    response = http_request('GET', f"{SUPABASE_URL}/rest/v1/counties", headers=headers, params=params)
+    print_latency_summary()
+"""
+
+import os
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter import host_limiter
+
+# (connect, read) seconds, used when a call passes no timeout
+DEFAULT_TIMEOUT = (
+    float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "5")),
+    float(os.getenv("HTTP_READ_TIMEOUT_SECONDS", "30")),
+)
+
+MAX_RETRIES = 4
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Connections kept alive per host in the shared session
+POOL_SIZE = 32
+
+session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+session.mount('https://', _adapter)
+session.mount('http://', _adapter)
+
+
+# =============================================================================
+# LATENCY METRICS
+# =============================================================================
+
+class HostStats:
+    """Attempt latencies and outcomes for one host"""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.retries = 0
+        self.errors = 0
+
+
+_stats: Dict[str, HostStats] = {}
+_stats_lock = threading.Lock()
+
+
+def _record(host: str, seconds: float, retried: bool = False, failed: bool = False) -> None:
+    with _stats_lock:
+        stats = _stats.setdefault(host, HostStats())
+        stats.latencies.append(seconds)
+        stats.retries += retried
+        stats.errors += failed
+
+
+def latency_summary() -> Dict[str, Dict]:
+    """Per host: calls, retries, errors and mean/p50/p95/max latency in ms"""
+    summary = {}
+    with _stats_lock:
+        for host, stats in _stats.items():
+            latencies = sorted(stats.latencies)
+            count = len(latencies)
+            summary[host] = {
+                'calls': count,
+                'retries': stats.retries,
+                'errors': stats.errors,
+                'mean_ms': round(sum(latencies) / count * 1000, 1),
+                'p50_ms': round(latencies[count // 2] * 1000, 1),
+                'p95_ms': round(latencies[min(count - 1, int(count * 0.95))] * 1000, 1),
+                'max_ms': round(latencies[-1] * 1000, 1),
+            }
+    return summary
+
+
+def reset_latency_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+def print_latency_summary() -> None:
+    summary = latency_summary()
+    if not summary:
+        return
+    print("HTTP latency by host:")
+    for host, stats in sorted(summary.items()):
+        print(f"   {host}: {stats['calls']} calls, {stats['retries']} retried, {stats['errors']} failed | "
+              f"mean {stats['mean_ms']}ms, p50 {stats['p50_ms']}ms, p95 {stats['p95_ms']}ms, "
+              f"max {stats['max_ms']}ms")
+
+
+# =============================================================================
+# REQUESTS
+# =============================================================================
+
+def backoff_seconds(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Exponential backoff with full jitter, or the server's Retry-After if longer"""
+    delay = random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+    if retry_after:
+        try:
+            delay = max(delay, min(BACKOFF_MAX_SECONDS, float(retry_after)))
+        except ValueError:
+            pass
+    return delay
+
+
+def http_request(method: str, url: str, max_retries: int = MAX_RETRIES, **kwargs) -> requests.Response:
+    """
+    Send a request on the shared session within its host's limits, retrying
+    429/5xx responses and connection errors. Returns the last response
+    (callers check its status); raises the last requests.RequestException if
+    every attempt failed to connect.
+
+    Request bodies must be replayable for retries (bytes or JSON, not an open file).
+    """
+    kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+    host = urlparse(url).hostname or ''
+    limiter = host_limiter(url)
+
+    for attempt in range(max_retries + 1):
+        started = time.perf_counter()
+        try:
+            with limiter:
+                started = time.perf_counter()
+                response = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            _record(host, time.perf_counter() - started, retried=attempt < max_retries, failed=True)
+            if attempt == max_retries:
+                raise
+            time.sleep(backoff_seconds(attempt))
+            continue
+
+        retry = response.status_code in RETRY_STATUSES and attempt < max_retries
+        _record(host, time.perf_counter() - started, retried=retry, failed=response.status_code >= 400)
+        if not retry:
+            return response
+        time.sleep(backoff_seconds(attempt, response.headers.get('Retry-After')))
+    return response
@@ -0,0 +1,142 @@
+"""
+PDF Layout Profiles
+Remembers how a county's property list PDFs are laid out, per county and sale
+type, so later pages and later runs skip pdfplumber's full-page auto-detection.
+
+A profile is learned on the first successful parse and stored as JSON:
+
+    {
+        "format": "upset",                        # detect_pdf_format result
+        "table_settings": {...},                  # explicit extract_tables settings
+        "table_bbox": [x0, top, x1, bottom],      # header + parsed rows on all pages
+        "column_edges": [x0, x1, ...],            # column boundaries on page 1
+        "header_row": ["CAMA #", ...] or null,    # page 1 header row, if any
+        "header_bbox": [x0, top, x1, bottom] or null,
+        "page_size": [width, height]
+    }
+
+Pages are then cropped to table_bbox's x range (over the full page height, so
+a later list whose rows run further down the page loses none of them) and
+extracted with table_settings; a page where that finds nothing falls back to
+full-page extraction with defaults.
+
+Usage:
+    profiles = LayoutProfiles()
+    profile = profiles.load(LayoutProfiles.key(county_id, 'upset'))
+    tables, row_boxes = find_page_tables(page, profile)
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+LAYOUT_PROFILE_DIR = Path(os.getenv("LAYOUT_PROFILE_DIR", str(Path(__file__).parent / ".cache" / "layouts")))
+
+# Table settings tried (in order) when learning a profile; ties keep the earlier one,
+# so PDFs that parse well with pdfplumber's defaults keep them
+TABLE_SETTINGS_CANDIDATES = [
+    {},
+    {"vertical_strategy": "lines", "horizontal_strategy": "text"},
+    {"vertical_strategy": "text", "horizontal_strategy": "text"},
+]
+
+# Points added left and right of the learned table area before cropping
+BBOX_MARGIN = 4
+
+# Pages whose size differs by more than this (points) don't use the profile
+PAGE_SIZE_TOLERANCE = 2
+
+
+class LayoutProfiles:
+    """JSON layout profiles on disk, one file per county + sale type"""
+
+    def __init__(self, profile_dir: Path = LAYOUT_PROFILE_DIR):
+        self.profile_dir = Path(profile_dir)
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(county_id: str, sale_type: Optional[str]) -> str:
+        return re.sub(r'[^A-Za-z0-9_-]+', '_', f"{county_id}-{sale_type or 'any'}")
+
+    def path(self, key: str) -> Path:
+        return self.profile_dir / f"{key}.json"
+
+    def load(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self.path(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, key: str, profile: Dict) -> None:
+        """Write the profile atomically (pipeline workers may learn the same county)"""
+        path = self.path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(profile, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def discard(self, key: str) -> None:
+        self.path(key).unlink(missing_ok=True)
+
+
+def profile_signature(profile: Optional[Dict]) -> str:
+    """Short hash of a profile, so parse cache entries follow profile changes"""
+    if not profile:
+        return "none"
+    return hashlib.sha256(json.dumps(profile, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def page_size_matches(profile: Dict, width: float, height: float) -> bool:
+    profile_width, profile_height = profile.get("page_size") or (width, height)
+    return (abs(profile_width - width) <= PAGE_SIZE_TOLERANCE and
+            abs(profile_height - height) <= PAGE_SIZE_TOLERANCE)
+
+
+def union_bbox(a: Optional[List[float]], b: Optional[List[float]]) -> Optional[List[float]]:
+    if not a:
+        return list(b) if b else None
+    if not b:
+        return list(a)
+    return [min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])]
+
+
+def column_edges(table) -> List[float]:
+    """x boundaries of a pdfplumber Table's columns"""
+    return sorted({round(x, 2) for column in table.columns for x in (column.bbox[0], column.bbox[2])})
+
+
+def normalize_row(row: list) -> List[str]:
+    return [' '.join(str(cell).split()).upper() if cell else '' for cell in row]
+
+
+def find_page_tables(page, profile: Optional[Dict] = None) -> Tuple[List[list], List[list]]:
+    """
+    Extract a page's tables, returning (tables, row bboxes per table).
+
+    With a profile the page is cropped to the learned table columns (full
+    height) and tables are found with the learned settings; otherwise (or if that finds nothing)
+    pdfplumber's full-page defaults are used.
+    """
+    if profile and page_size_matches(profile, page.width, page.height):
+        region = page
+        bbox = profile.get("table_bbox")
+        if bbox:
+            region = page.crop((
+                max(0, bbox[0] - BBOX_MARGIN), 0, min(page.width, bbox[2] + BBOX_MARGIN), page.height
+            ))
+        found = region.find_tables(profile.get("table_settings") or {})
+        tables = [table.extract() for table in found]
+        if any(tables):
+            return tables, [row_bboxes(table) for table in found]
+
+    found = page.find_tables()
+    return [table.extract() for table in found], [row_bboxes(table) for table in found]
+
+
+def row_bboxes(table) -> List[List[float]]:
+    """bbox of each row of a pdfplumber Table, aligned with table.extract()"""
+    return [list(row.bbox) for row in table.rows]
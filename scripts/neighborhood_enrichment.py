@@ -7,6 +7,8 @@ Usage:
     python neighborhood_enrichment.py --property-id <uuid>
     python neighborhood_enrichment.py --county Blair --state PA --limit 10
     python neighborhood_enrichment.py --property-id test-uuid --dry-run
+    python neighborhood_enrichment.py --county Blair --state PA --osm-index blair
+    python neighborhood_enrichment.py --county Blair --state PA --limit 1000 --concurrency 16
 
 This script orchestrates multiple data sources to create a complete neighborhood profile:
 1. Crime statistics (FBI Crime Data API - state level)
@@ -14,21 +16,35 @@ This script orchestrates multiple data sources to create a complete neighborhood
 3. Road access analysis (OpenStreetMap via osm_access_analyzer.py)
 4. School ratings (placeholder for future API integration)
 5. Amenity distances (OpenStreetMap POI data)
+   (road access and amenities come from a local index with --osm-index, see osm_local_index.py)
 6. Comprehensive neighborhood score calculation
+
+Batch mode enriches --concurrency properties at once; per-host rate limits and
+retries for every API are applied in http_client.py and rate_limiter.py.
 """
 
 import argparse
 import requests
-import math
+import numpy as np
 import json
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 # Add scripts directory to path to import osm_access_analyzer
 sys.path.insert(0, str(Path(__file__).parent))
+from analysis_store import AnalysisWriter, build_analysis_row, upsert_analyses_bulk
+from api_cache import ApiCache
+from county_boundaries import lookup_county
+from geo import haversine_distances
+from http_client import http_request, print_latency_summary
 from osm_access_analyzer import analyze_road_access, get_property_coordinates
+from osm_local_index import AMENITY_TYPES, OsmIndex, index_available
+from property_work_set import fetch_work_set
 
 # Supabase Configuration
 SUPABASE_URL = "https://oiiwlzobizftprqspbzt.supabase.co"
@@ -38,14 +54,25 @@ SUPABASE_KEY = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJpc3MiOiJzdXBhYmFzZSIsInJ
 FBI_API_BASE = "https://api.usa.gov/crime/fbi/cde"
 FBI_API_KEY = ""  # Public API - key optional
 
+# State crime statistics are annual; one lookup per state serves every property
+CRIME_CACHE_TTL_SECONDS = int(os.getenv("CRIME_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+crime_cache = ApiCache("fbi_crime_estimates", CRIME_CACHE_TTL_SECONDS)
+
 # Census API Configuration
 CENSUS_GEO_API = "https://geocoding.geo.census.gov"
 CENSUS_DATA_API = "https://api.census.gov/data"
 CENSUS_API_KEY = ""  # Optional for most endpoints
 
+# ACS 5-year estimates change once a year; cached per county FIPS
+ACS_CACHE_TTL_SECONDS = int(os.getenv("ACS_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+acs_cache = ApiCache("census_acs5_county", ACS_CACHE_TTL_SECONDS)
+
 # Overpass API for amenities
 OVERPASS_API_URL = "https://overpass-api.de/api/interpreter"
 
+# Batch mode: properties enriched at once (API rate limits live in rate_limiter.py)
+DEFAULT_CONCURRENCY = int(os.getenv("ENRICHMENT_CONCURRENCY", "8"))
+
 # State FIPS codes
 STATE_FIPS = {
     'AL': '01', 'AK': '02', 'AZ': '04', 'AR': '05', 'CA': '06', 'CO': '08', 'CT': '09', 'DE': '10',
@@ -64,24 +91,6 @@ NATIONAL_CRIME_AVERAGES = {
 }
 
 
-def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """
-    Calculate the great circle distance between two points on Earth (in meters).
-    """
-    R = 6371000  # Earth's radius in meters
-
-    phi1 = math.radians(lat1)
-    phi2 = math.radians(lat2)
-    delta_phi = math.radians(lat2 - lat1)
-    delta_lambda = math.radians(lon2 - lon1)
-
-    a = math.sin(delta_phi / 2) ** 2 + \
-        math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-    return R * c
-
-
 def meters_to_miles(meters: float) -> float:
     """Convert meters to miles."""
     return meters * 0.000621371
@@ -91,6 +100,9 @@ def fetch_crime_statistics(state_code: str) -> Optional[Dict]:
     """
     Fetch state-level crime statistics from FBI Crime Data API.
 
+    Results are cached per state and year range (crime_cache, in-process
+    and on disk for CRIME_CACHE_TTL_SECONDS).
+
     Args:
         state_code: Two-letter state code (e.g., 'PA')
 
@@ -103,18 +115,33 @@ def fetch_crime_statistics(state_code: str) -> Optional[Dict]:
 
     current_year = datetime.now().year
     from_year = current_year - 5
+    return crime_cache.get_or_fetch(
+        f"{state_code}:{from_year}-{current_year - 1}",
+        lambda: request_crime_statistics(state_code, from_year, current_year - 1)
+    )
+
+
+def prefill_crime_statistics(state_codes: List[str]) -> None:
+    """Fetch (or load from cache) crime statistics for each state before a batch"""
+    for state_code in sorted({code.upper() for code in state_codes}):
+        crime = fetch_crime_statistics(state_code)
+        status = f"{crime.get('data_year')} data" if crime else "unavailable"
+        print(f"Crime statistics for {state_code}: {status}")
+
 
+def request_crime_statistics(state_code: str, from_year: int, to_year: int) -> Optional[Dict]:
+    """Request state crime estimates for a year range from the FBI Crime Data API (uncached)"""
     endpoint = f"{FBI_API_BASE}/estimates/states/{state_code}"
     params = {
         'from': from_year,
-        'to': current_year - 1,  # Data lags by 1-2 years
+        'to': to_year,  # Data lags by 1-2 years
     }
 
     if FBI_API_KEY:
         params['api_key'] = FBI_API_KEY
 
     try:
-        response = requests.get(endpoint, params=params, timeout=30)
+        response = http_request('GET', endpoint, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
 
@@ -160,6 +187,11 @@ def fetch_demographics(latitude: float, longitude: float) -> Optional[Dict]:
     """
     Fetch county-level demographics from Census API.
 
+    The county comes from the local TIGER boundaries when available
+    (county_boundaries.py), else the Census geocoder; ACS results are
+    cached per county FIPS (acs_cache), so most properties of a county batch
+    need no network call.
+
     Args:
         latitude: Property latitude
         longitude: Property longitude
@@ -168,6 +200,22 @@ def fetch_demographics(latitude: float, longitude: float) -> Optional[Dict]:
         Dict with demographics or None if unavailable
     """
     # Step 1: Get FIPS code from coordinates
+    county = lookup_county(latitude, longitude) or request_county_fips(latitude, longitude)
+    if not county:
+        return None
+    state_fips, county_fips, county_name = county
+
+    # Step 2: Fetch ACS demographic data
+    demographics = acs_cache.get_or_fetch(
+        f"{state_fips}{county_fips}", lambda: request_acs_demographics(state_fips, county_fips)
+    )
+    if not demographics:
+        return None
+    return {**demographics, 'county_name': county_name}
+
+
+def request_county_fips(latitude: float, longitude: float) -> Optional[Tuple[str, str, str]]:
+    """(state FIPS, county FIPS, county name) from the Census geocoder"""
     geo_endpoint = f"{CENSUS_GEO_API}/geocoder/geographies/coordinates"
     geo_params = {
         'x': longitude,
@@ -179,155 +227,166 @@ def fetch_demographics(latitude: float, longitude: float) -> Optional[Dict]:
     }
 
     try:
-        geo_response = requests.get(geo_endpoint, params=geo_params, timeout=30)
+        geo_response = http_request('GET', geo_endpoint, params=geo_params, timeout=30)
         geo_response.raise_for_status()
         geo_data = geo_response.json()
+    except requests.RequestException:
+        return None
 
-        geographies = geo_data.get('result', {}).get('geographies', {})
-        counties = geographies.get('Counties', []) or geographies.get('2020 Census Counties', [])
-        states = geographies.get('States', []) or geographies.get('2020 Census State', [])
+    geographies = geo_data.get('result', {}).get('geographies', {})
+    counties = geographies.get('Counties', []) or geographies.get('2020 Census Counties', [])
+    states = geographies.get('States', []) or geographies.get('2020 Census State', [])
 
-        if not counties or not states:
-            return None
+    if not counties or not states:
+        return None
 
-        state_fips = states[0].get('STATE', '')
-        county_fips = counties[0].get('COUNTY', '')
-        county_name = counties[0].get('NAME', '')
-
-        # Step 2: Fetch ACS demographic data
-        # Try years in order (most recent first)
-        for year in [2023, 2022, 2021]:
-            acs_endpoint = f"{CENSUS_DATA_API}/{year}/acs/acs5"
-
-            variables = [
-                'NAME',
-                'B01003_001E',  # Total Population
-                'B19013_001E',  # Median Household Income
-                'B17001_002E',  # Population Below Poverty Level
-                'B01002_001E',  # Median Age
-                'B15003_022E',  # Bachelor's Degree
-            ]
-
-            acs_params = {
-                'get': ','.join(variables),
-                'for': f'county:{county_fips}',
-                'in': f'state:{state_fips}',
-            }
+    return states[0].get('STATE', ''), counties[0].get('COUNTY', ''), counties[0].get('NAME', '')
 
-            if CENSUS_API_KEY:
-                acs_params['key'] = CENSUS_API_KEY
 
-            try:
-                acs_response = requests.get(acs_endpoint, params=acs_params, timeout=30)
-                acs_response.raise_for_status()
-                acs_data = acs_response.json()
-
-                if len(acs_data) < 2:
-                    continue  # Try next year
-
-                headers = acs_data[0]
-                values = acs_data[1]
-
-                # Create header index map
-                header_map = {header: idx for idx, header in enumerate(headers)}
-
-                def get_value(var: str, default=0):
-                    idx = header_map.get(var)
-                    if idx is None:
-                        return default
-                    try:
-                        val = float(values[idx])
-                        return val if val >= 0 else default
-                    except (ValueError, IndexError):
-                        return default
-
-                population = get_value('B01003_001E')
-                median_income = get_value('B19013_001E')
-                poverty_pop = get_value('B17001_002E')
-                median_age = get_value('B01002_001E')
-                bachelors = get_value('B15003_022E')
-
-                poverty_rate = (poverty_pop / population * 100) if population > 0 else 0
-                education_level = (bachelors / (population * 0.75) * 100) if population > 0 else 0
-
-                return {
-                    'population': int(population),
-                    'median_income': int(median_income),
-                    'poverty_rate': round(poverty_rate, 2),
-                    'median_age': round(median_age, 1),
-                    'education_level': round(min(100, education_level), 2),
-                    'county_name': county_name,
-                    'data_year': year,
-                }
-            except requests.RequestException:
+def request_acs_demographics(state_fips: str, county_fips: str) -> Optional[Dict]:
+    """County demographics from the most recent ACS 5-year release available (uncached)"""
+    # Try years in order (most recent first)
+    for year in [2023, 2022, 2021]:
+        acs_endpoint = f"{CENSUS_DATA_API}/{year}/acs/acs5"
+
+        variables = [
+            'NAME',
+            'B01003_001E',  # Total Population
+            'B19013_001E',  # Median Household Income
+            'B17001_002E',  # Population Below Poverty Level
+            'B01002_001E',  # Median Age
+            'B15003_022E',  # Bachelor's Degree
+        ]
+
+        acs_params = {
+            'get': ','.join(variables),
+            'for': f'county:{county_fips}',
+            'in': f'state:{state_fips}',
+        }
+
+        if CENSUS_API_KEY:
+            acs_params['key'] = CENSUS_API_KEY
+
+        try:
+            acs_response = http_request('GET', acs_endpoint, params=acs_params, timeout=30)
+            acs_response.raise_for_status()
+            acs_data = acs_response.json()
+
+            if len(acs_data) < 2:
                 continue  # Try next year
 
-        return None  # All years failed
-    except requests.RequestException:
-        return None
+            headers = acs_data[0]
+            values = acs_data[1]
+
+            # Create header index map
+            header_map = {header: idx for idx, header in enumerate(headers)}
+
+            def get_value(var: str, default=0):
+                idx = header_map.get(var)
+                if idx is None:
+                    return default
+                try:
+                    val = float(values[idx])
+                    return val if val >= 0 else default
+                except (ValueError, IndexError):
+                    return default
+
+            population = get_value('B01003_001E')
+            median_income = get_value('B19013_001E')
+            poverty_pop = get_value('B17001_002E')
+            median_age = get_value('B01002_001E')
+            bachelors = get_value('B15003_022E')
+
+            poverty_rate = (poverty_pop / population * 100) if population > 0 else 0
+            education_level = (bachelors / (population * 0.75) * 100) if population > 0 else 0
+
+            return {
+                'population': int(population),
+                'median_income': int(median_income),
+                'poverty_rate': round(poverty_rate, 2),
+                'median_age': round(median_age, 1),
+                'education_level': round(min(100, education_level), 2),
+                'data_year': year,
+            }
+        except requests.RequestException:
+            continue  # Try next year
+
+    return None  # All years failed
 
 
-def fetch_amenity_distances(latitude: float, longitude: float) -> Optional[Dict]:
+def fetch_amenity_distances(latitude: float, longitude: float,
+                            osm_index: Optional[OsmIndex] = None) -> Optional[Dict]:
     """
     Fetch distances to key amenities using OpenStreetMap Overpass API.
 
+    All amenity types are fetched in one union query; each returned node is
+    assigned to its amenity type by its tags. With osm_index the distances
+    come from the local index instead.
+
     Args:
         latitude: Property latitude
         longitude: Property longitude
+        osm_index: Local OSM index (osm_local_index.py)
 
     Returns:
         Dict with amenity distances in miles
     """
-    # Define amenity types to search for
-    amenity_queries = {
-        'grocery': 'node["shop"="supermarket"](around:8000,{lat},{lon});',
-        'hospital': 'node["amenity"="hospital"](around:16000,{lat},{lon});',
-        'shopping': 'node["shop"="mall"](around:16000,{lat},{lon});',
-        'park': 'node["leisure"="park"](around:8000,{lat},{lon});',
-        'school': 'node["amenity"="school"](around:8000,{lat},{lon});',
-    }
-
-    distances = {}
+    if osm_index is not None:
+        return {
+            f'{amenity_type}_mi': round(meters_to_miles(distance_meters), 2) if distance_meters is not None else None
+            for amenity_type, distance_meters in osm_index.amenity_distances(latitude, longitude).items()
+        }
 
-    for amenity_type, query_template in amenity_queries.items():
-        query = query_template.format(lat=latitude, lon=longitude)
-        overpass_query = f"""
+    clauses = "\n          ".join(
+        f'node["{key}"="{value}"](around:{radius},{latitude},{longitude});'
+        for key, value, radius in AMENITY_TYPES.values()
+    )
+    overpass_query = f"""
         [out:json][timeout:25];
         (
-          {query}
+          {clauses}
         );
         out body;
         """
 
-        try:
-            response = requests.post(
-                OVERPASS_API_URL,
-                data={'data': overpass_query},
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            elements = data.get('elements', [])
-            if elements:
-                # Find nearest amenity
-                min_distance = float('inf')
-                for element in elements:
-                    elem_lat = element.get('lat')
-                    elem_lon = element.get('lon')
-                    if elem_lat and elem_lon:
-                        distance_meters = haversine_distance(latitude, longitude, elem_lat, elem_lon)
-                        min_distance = min(min_distance, distance_meters)
-
-                if min_distance != float('inf'):
-                    distances[f'{amenity_type}_mi'] = round(meters_to_miles(min_distance), 2)
-                else:
-                    distances[f'{amenity_type}_mi'] = None
-            else:
-                distances[f'{amenity_type}_mi'] = None
+    distances = {f'{amenity_type}_mi': None for amenity_type in AMENITY_TYPES}
 
-        except requests.RequestException:
-            distances[f'{amenity_type}_mi'] = None
+    try:
+        response = http_request(
+            'POST',
+            OVERPASS_API_URL,
+            data={'data': overpass_query},
+            timeout=30
+        )
+        response.raise_for_status()
+        elements = response.json().get('elements', [])
+    except (requests.RequestException, ValueError):
+        return distances
+
+    # Group the returned nodes by amenity type, measure to all of them at
+    # once, then take the nearest of each type
+    amenity_tags = {(key, value): amenity_type for amenity_type, (key, value, _) in AMENITY_TYPES.items()}
+    tag_keys = {key for key, _ in amenity_tags}
+    lats, lons, types = [], [], []
+    for element in elements:
+        if not (element.get('lat') and element.get('lon')):
+            continue
+        tags = element.get('tags', {})
+        for key in tag_keys:
+            amenity_type = amenity_tags.get((key, tags.get(key)))
+            if amenity_type:
+                lats.append(element['lat'])
+                lons.append(element['lon'])
+                types.append(amenity_type)
+    if not types:
+        return distances
+
+    distances_meters = haversine_distances(latitude, longitude, lats, lons)
+    types = np.array(types)
+    for amenity_type in AMENITY_TYPES:
+        is_type = types == amenity_type
+        if is_type.any():
+            distances[f'{amenity_type}_mi'] = round(meters_to_miles(float(distances_meters[is_type].min())), 2)
 
     return distances
 
@@ -466,7 +525,8 @@ def store_neighborhood_analysis(
     amenity_distances: Optional[Dict],
     school_ratings: Optional[Dict],
     scores: Dict,
-    data_completeness: float
+    data_completeness: float,
+    writer: Optional[AnalysisWriter] = None
 ) -> bool:
     """
     Store neighborhood analysis in the database.
@@ -480,72 +540,43 @@ def store_neighborhood_analysis(
         school_ratings: School ratings dict (placeholder)
         scores: Calculated scores dict
         data_completeness: Data completeness percentage
+        writer: Batch writer to queue the row on (failures reported by the
+            writer when it flushes); None stores it immediately
 
     Returns:
-        bool: Success status
+        bool: Success status (True once queued when a writer is given)
     """
-    headers = {
-        "Authorization": f"Bearer {SUPABASE_KEY}",
-        "apikey": SUPABASE_KEY,
-        "Content-Type": "application/json",
-    }
-
-    # Convert distance from meters to feet if present
-    distance_to_public_road_ft = None
-    if access_data and access_data.get('distance_to_public_road'):
-        distance_to_public_road_ft = round(access_data['distance_to_public_road'] * 3.28084, 2)
-
-    # Build road access data
-    road_access_data = None
-    if access_data:
-        road_access_data = {
-            'distance_to_public_road': access_data.get('distance_to_public_road'),
-            'nearest_road_name': access_data.get('nearest_road_name'),
-            'road_types_nearby': access_data.get('road_types_nearby', [])
-        }
-
-    # Prepare data for upsert function
-    data = {
-        'p_property_id': property_id,
-        'p_crime_statistics': crime_stats,
-        'p_crime_data_source': 'fbi_ucr' if crime_stats else None,
-        'p_demographics': demographics,
-        'p_demographics_source': 'census_acs' if demographics else None,
-        'p_landlocked_status': access_data.get('landlocked', False) if access_data else False,
-        'p_road_access_type': access_data.get('road_access_type') if access_data else None,
-        'p_distance_to_public_road_ft': distance_to_public_road_ft,
-        'p_access_notes': f"Analysis via OpenStreetMap. Road access data: {road_access_data}" if road_access_data else None,
-        'p_school_ratings': school_ratings,
-        'p_school_data_source': None,  # Placeholder for future integration
-        'p_amenity_distances': amenity_distances,
-        'p_amenity_data_source': 'osm' if amenity_distances else None,
-        'p_neighborhood_score': scores.get('neighborhood_score'),
-        'p_safety_score': scores.get('safety_score'),
-        'p_walkability_score': scores.get('walkability_score'),
-        'p_school_score': scores.get('school_score'),
-        'p_access_score': scores.get('access_score'),
-        'p_data_completeness': data_completeness,
-        'p_analysis_confidence': data_completeness,  # Use completeness as confidence proxy
-    }
-
-    # Call the upsert function
-    rpc_url = f"{SUPABASE_URL}/rest/v1/rpc/upsert_neighborhood_analysis"
+    row = build_analysis_row(
+        property_id,
+        crime_stats,
+        demographics,
+        access_data,
+        amenity_distances,
+        school_ratings,
+        scores,
+        data_completeness
+    )
 
-    try:
-        response = requests.post(rpc_url, headers=headers, json=data)
-        response.raise_for_status()
+    if writer is not None:
+        writer.add(row)
         return True
-    except requests.RequestException as e:
-        return False
 
+    errors = upsert_analyses_bulk(SUPABASE_URL, SUPABASE_KEY, [row])
+    return not errors[property_id]
 
-def enrich_property(property_id: str, dry_run: bool = False) -> Dict:
+
+def enrich_property(property_id: str, dry_run: bool = False, osm_index: Optional[OsmIndex] = None,
+                    writer: Optional[AnalysisWriter] = None, prop: Optional[Dict] = None) -> Dict:
     """
     Run complete neighborhood enrichment for a single property.
 
     Args:
         property_id: UUID of the property
         dry_run: If True, don't store results in database
+        osm_index: Local OSM index for road access and amenities (else Overpass)
+        writer: Batch writer to queue the analysis on (None = store immediately)
+        prop: Work-set row (property_work_set) with coordinates and state_code;
+            without one they are looked up per property
 
     Returns:
         Dict with enrichment results
@@ -557,42 +588,47 @@ def enrich_property(property_id: str, dry_run: bool = False) -> Dict:
         'data': {}
     }
 
-    # Get property coordinates
-    coords = get_property_coordinates(property_id)
-    if not coords:
-        result['error'] = "Could not find property coordinates. Ensure property has Regrid data."
-        return result
+    if prop and prop.get('latitude') is not None and prop.get('longitude') is not None:
+        # Work-set rows already carry coordinates and state
+        latitude, longitude = float(prop['latitude']), float(prop['longitude'])
+        state_code = prop.get('state_code') or 'PA'
+    else:
+        # Get property coordinates
+        coords = get_property_coordinates(property_id)
+        if not coords:
+            result['error'] = "Could not find property coordinates. Ensure property has Regrid data."
+            return result
 
-    latitude, longitude = coords
+        latitude, longitude = coords
 
-    # Get state code from database
-    headers = {
-        "Authorization": f"Bearer {SUPABASE_KEY}",
-        "apikey": SUPABASE_KEY,
-    }
+        # Get state code from database
+        headers = {
+            "Authorization": f"Bearer {SUPABASE_KEY}",
+            "apikey": SUPABASE_KEY,
+        }
 
-    props_url = f"{SUPABASE_URL}/rest/v1/properties"
-    params = {
-        "id": f"eq.{property_id}",
-        "select": "state_code"
-    }
+        props_url = f"{SUPABASE_URL}/rest/v1/properties"
+        params = {
+            "id": f"eq.{property_id}",
+            "select": "state_code"
+        }
 
-    try:
-        response = requests.get(props_url, headers=headers, params=params)
-        response.raise_for_status()
-        prop_data = response.json()
-        if not prop_data:
-            result['error'] = "Property not found in database"
-            return result
-        state_code = prop_data[0].get('state_code', 'PA')
-    except requests.RequestException:
-        state_code = 'PA'  # Default fallback
+        try:
+            response = http_request('GET', props_url, headers=headers, params=params)
+            response.raise_for_status()
+            prop_data = response.json()
+            if not prop_data:
+                result['error'] = "Property not found in database"
+                return result
+            state_code = prop_data[0].get('state_code', 'PA')
+        except requests.RequestException:
+            state_code = 'PA'  # Default fallback
 
     # Fetch all data sources
     crime_stats = fetch_crime_statistics(state_code)
     demographics = fetch_demographics(latitude, longitude)
-    access_data = analyze_road_access(latitude, longitude)
-    amenity_distances = fetch_amenity_distances(latitude, longitude)
+    access_data = analyze_road_access(latitude, longitude, osm_index)
+    amenity_distances = fetch_amenity_distances(latitude, longitude, osm_index)
     school_ratings = None  # Placeholder for future school API integration
 
     # Calculate scores
@@ -603,15 +639,18 @@ def enrich_property(property_id: str, dry_run: bool = False) -> Dict:
 
     # Store results (unless dry run)
     if not dry_run:
+        # A failed access analysis leaves the stored access fields alone (and
+        # the property in the access queue) instead of recording 'unknown'
         success = store_neighborhood_analysis(
             property_id,
             crime_stats,
             demographics,
-            access_data,
+            None if 'error' in access_data else access_data,
             amenity_distances,
             school_ratings,
             scores,
-            data_completeness
+            data_completeness,
+            writer
         )
         result['success'] = success
     else:
@@ -633,7 +672,8 @@ def enrich_property(property_id: str, dry_run: bool = False) -> Dict:
 
 def get_properties_needing_enrichment(county_name: str = "Blair", state_code: str = "PA", limit: int = 10) -> List[Dict]:
     """
-    Get properties that need neighborhood enrichment.
+    Get properties that need neighborhood enrichment, with their coordinates
+    and state, in one paged work-set query.
 
     Args:
         county_name: County name
@@ -643,42 +683,99 @@ def get_properties_needing_enrichment(county_name: str = "Blair", state_code: st
     Returns:
         List of property dicts
     """
-    headers = {
-        "Authorization": f"Bearer {SUPABASE_KEY}",
-        "apikey": SUPABASE_KEY,
-    }
+    try:
+        return fetch_work_set(SUPABASE_URL, SUPABASE_KEY, 'neighborhood', county_name, state_code, limit)
+    except requests.RequestException as e:
+        return []
 
-    # Get county_id first
-    county_url = f"{SUPABASE_URL}/rest/v1/counties"
-    params = {
-        "county_name": f"eq.{county_name}",
-        "state_code": f"eq.{state_code}",
-        "select": "id"
-    }
 
-    try:
-        response = requests.get(county_url, headers=headers, params=params)
-        response.raise_for_status()
-        county_data = response.json()
+# =============================================================================
+# BATCH ENGINE
+# =============================================================================
 
-        if not county_data:
-            return []
+def print_batch_result(position: int, total: int, prop: Dict, result: Dict, dry_run: bool):
+    """Print one property's outcome in the batch progress format."""
+    print(f"[{position}/{total}] {prop['parcel_id']}")
 
-        county_id = county_data[0]["id"]
+    if result['error']:
+        print(f"  ✗ Error: {result['error']}")
+        print()
+        return
 
-        # Call the helper function to get properties needing analysis
-        rpc_url = f"{SUPABASE_URL}/rest/v1/rpc/get_properties_needing_neighborhood_analysis"
-        rpc_data = {
-            "p_county_id": county_id,
-            "p_limit": limit
-        }
+    scores = result['data'].get('scores', {})
+    neighborhood_score = scores.get('neighborhood_score', 'N/A')
 
-        response = requests.post(rpc_url, headers=headers, json=rpc_data)
-        response.raise_for_status()
+    print(f"  Neighborhood Score: {neighborhood_score}/10")
 
-        return response.json()
-    except requests.RequestException as e:
-        return []
+    if result['success']:
+        print(f"  ✓ {'Analyzed (dry run)' if dry_run else 'Queued for storage'}")
+    else:
+        print(f"  ✗ Failed to store")
+
+    print()
+
+
+def enrich_properties_concurrently(properties: List[Dict], concurrency: int = DEFAULT_CONCURRENCY,
+                                   dry_run: bool = False, osm_index: Optional[OsmIndex] = None) -> List[Dict]:
+    """
+    Enrich a batch of properties concurrently.
+
+    Up to `concurrency` properties are enriched at once on a thread pool.
+    Their HTTP calls are ordinary blocking http_client calls, which apply the
+    per-host concurrency and rate limits and the retries, so the batch runs
+    as fast as each API's limits allow rather than one request latency at a
+    time. Progress is printed as properties finish.
+
+    Analyses are queued on an AnalysisWriter and stored in bulk; rows the
+    database rejects are reported after the final flush and their results
+    marked unsuccessful.
+
+    Args:
+        properties: Property dicts from get_properties_needing_enrichment
+        concurrency: Properties in flight at once
+        dry_run: If True, don't store results
+        osm_index: Local OSM index for road access and amenities (None = Overpass)
+
+    Returns:
+        enrich_property results, in the order of properties
+    """
+    results: List[Optional[Dict]] = [None] * len(properties)
+    started = time.perf_counter()
+    writer = None if dry_run else AnalysisWriter(SUPABASE_URL, SUPABASE_KEY)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(enrich_property, prop['property_id'], dry_run, osm_index, writer, prop): index
+            for index, prop in enumerate(properties)
+        }
+        for position, future in enumerate(as_completed(futures), 1):
+            index = futures[future]
+            prop = properties[index]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'property_id': prop['property_id'], 'success': False, 'error': str(e), 'data': {}}
+            results[index] = result
+            print_batch_result(position, len(properties), prop, result, dry_run)
+
+    if writer:
+        writer.flush()
+        if writer.failed:
+            print(f"✗ Failed to store {len(writer.failed)} analyses:")
+            for prop, result in zip(properties, results):
+                error = writer.failed.get(prop['property_id'])
+                if error:
+                    result['success'] = False
+                    print(f"  {prop['parcel_id']}: {error}")
+            print()
+
+    elapsed = time.perf_counter() - started
+    succeeded = sum(1 for result in results if result['success'])
+    print(f"Enriched {succeeded}/{len(properties)} properties in {elapsed:.1f}s "
+          f"({len(properties) / elapsed if elapsed else 0:.2f} properties/s, concurrency {concurrency})")
+    print_latency_summary()
+
+    return results
 
 
 def main():
@@ -699,6 +796,12 @@ Examples:
 
   # Get list of properties needing enrichment
   python neighborhood_enrichment.py --list-pending --county Blair --state PA
+
+  # Road access and amenities from a local OSM index (see osm_local_index.py)
+  python neighborhood_enrichment.py --county Blair --state PA --osm-index blair
+
+  # Enrich a large batch 16 properties at a time (API rate limits still apply)
+  python neighborhood_enrichment.py --county Blair --state PA --limit 1000 --concurrency 16
         """
     )
 
@@ -708,9 +811,21 @@ Examples:
     parser.add_argument('--limit', type=int, default=10, help='Number of properties to process (default: 10)')
     parser.add_argument('--list-pending', action='store_true', help='List properties needing enrichment')
     parser.add_argument('--dry-run', action='store_true', help='Dry run - don\'t store results')
+    parser.add_argument('--osm-index', help='Local OSM index name or path (built with osm_local_index.py)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Properties enriched at once in batch mode (default: {DEFAULT_CONCURRENCY})')
 
     args = parser.parse_args()
 
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+
+    osm_index = None
+    if args.osm_index:
+        if not index_available():
+            parser.error('--osm-index requires scipy and shapely (pip install scipy shapely)')
+        osm_index = OsmIndex.load(args.osm_index)
+
     # Mode 1: List pending properties
     if args.list_pending:
         properties = get_properties_needing_enrichment(args.county, args.state, args.limit)
@@ -730,7 +845,7 @@ Examples:
             print("DRY RUN MODE - Results will not be stored")
         print(f"{'='*60}\n")
 
-        result = enrich_property(args.property_id, args.dry_run)
+        result = enrich_property(args.property_id, args.dry_run, osm_index)
 
         if result['error']:
             print(f"✗ Error: {result['error']}")
@@ -821,31 +936,12 @@ Examples:
         print("No properties found needing neighborhood enrichment.")
         return
 
-    print(f"Processing {len(properties)} properties...\n")
-
-    for i, prop in enumerate(properties, 1):
-        property_id = prop['property_id']
-        parcel_id = prop['parcel_id']
-
-        print(f"[{i}/{len(properties)}] {parcel_id}")
-
-        result = enrich_property(property_id, args.dry_run)
-
-        if result['error']:
-            print(f"  ✗ Error: {result['error']}")
-            continue
-
-        scores = result['data'].get('scores', {})
-        neighborhood_score = scores.get('neighborhood_score', 'N/A')
-
-        print(f"  Neighborhood Score: {neighborhood_score}/10")
+    # State-level data is the same for every property: fetch it once up front
+    prefill_crime_statistics([args.state])
 
-        if result['success']:
-            print(f"  ✓ {'Analyzed (dry run)' if args.dry_run else 'Stored'}")
-        else:
-            print(f"  ✗ Failed to store")
+    print(f"Processing {len(properties)} properties...\n")
 
-        print()
+    enrich_properties_concurrently(properties, args.concurrency, args.dry_run, osm_index)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,335 @@
+"""
+OCR Pipeline
+Reads scanned county property lists (pages with images but no text layer)
+with Tesseract and rebuilds their table rows, so they parse like any other PDF.
+
+Each scanned page is rendered at OCR_DPI, run through Tesseract in a process
+pool and cached by a hash of the page's image data plus the OCR settings, so a
+re-run (or the same scan attached to a different document) skips Tesseract.
+Rows are rebuilt from word boxes:
+
+1. words are grouped into lines by their vertical centre
+2. each line is split into cells at gaps wider than CELL_GAP_RATIO x line height
+3. columns are the x ranges covered by cells on at least COLUMN_SUPPORT of the
+   multi-cell lines (plus ranges covered only by cells outside every column,
+   e.g. municipality headers in their own leading column)
+4. every cell goes to the column it overlaps most
+
+pytesseract and the tesseract binary are optional: without them, scanned pages
+are skipped with a warning (cached OCR results are still used).
+
+Usage:
+    pages = fill_scanned_pages(iter_extracted_pages(pdf_path, workers), pdf_path, workers)
+    for page_num, page_text, tables, row_boxes, scanned in pages:
+        ...
+"""
+
+import hashlib
+import json
+import os
+import statistics
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pdfplumber
+
+try:
+    import pytesseract
+except ImportError:  # Optional dependency - scanned pages are skipped without it
+    pytesseract = None
+
+OCR_CACHE_DIR = Path(os.getenv("OCR_CACHE_DIR", str(Path(__file__).parent / ".cache" / "ocr")))
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", str(os.cpu_count() or 1)))
+
+# Tesseract settings (part of the cache key)
+OCR_DPI = 300
+OCR_LANG = os.getenv("OCR_LANG", "eng")
+OCR_PSM = 6  # Assume a single uniform block of text; keeps table lines intact
+OCR_SETTINGS = f"dpi={OCR_DPI}|lang={OCR_LANG}|psm={OCR_PSM}"
+
+# Words Tesseract is less sure of than this (0-100) are dropped
+OCR_MIN_WORD_CONFIDENCE = 30
+
+# Confidence ceiling for properties parsed from OCR'd rows
+OCR_ROW_CONFIDENCE = 0.85
+
+# Row rebuilding
+CELL_GAP_RATIO = 0.8   # Word gap (x median word height) that starts a new cell
+COLUMN_SUPPORT = 0.10  # Share of multi-cell lines that must cover an x position
+
+
+# =============================================================================
+# TESSERACT
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def ocr_engine_version() -> str:
+    """Tesseract version, or "none" when pytesseract or the binary is missing"""
+    if pytesseract is None:
+        return "none"
+    try:
+        return str(pytesseract.get_tesseract_version())
+    except (OSError, pytesseract.TesseractNotFoundError):
+        return "none"
+
+
+def ocr_available() -> bool:
+    return ocr_engine_version() != "none"
+
+
+def page_needs_ocr(page) -> bool:
+    """A page with images but no text layer"""
+    return not page.chars and bool(page.images)
+
+
+def page_image_hash(page) -> str:
+    """Hash of a page's image streams, size and the OCR settings"""
+    digest = hashlib.sha256(f"{OCR_SETTINGS}|{page.width}x{page.height}".encode())
+    for image in page.images:
+        digest.update(repr((image["x0"], image["top"], image["x1"], image["bottom"])).encode())
+        digest.update(image["stream"].get_rawdata() or b"")
+    return digest.hexdigest()
+
+
+def cache_path(page_hash: str) -> Path:
+    return OCR_CACHE_DIR / f"{page_hash}.json"
+
+
+def load_cached_words(page_hash: str) -> Optional[List[Dict]]:
+    try:
+        with open(cache_path(page_hash)) as f:
+            return json.load(f)["words"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_cached_words(page_hash: str, words: List[Dict]) -> None:
+    """Write atomically (several workers may OCR identical pages)"""
+    OCR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = cache_path(page_hash)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"settings": OCR_SETTINGS, "engine": ocr_engine_version(), "words": words}, f)
+    os.replace(tmp_path, path)
+
+
+def run_tesseract(page) -> List[Dict]:
+    """OCR a rendered page; word boxes are returned in PDF points (top-left origin)"""
+    image = page.to_image(resolution=OCR_DPI).original
+    data = pytesseract.image_to_data(image, lang=OCR_LANG, config=f"--psm {OCR_PSM}",
+                                     output_type=pytesseract.Output.DICT)
+    scale = 72 / OCR_DPI
+    words = []
+    for i, text in enumerate(data["text"]):
+        text = text.strip()
+        confidence = float(data["conf"][i])
+        if not text or confidence < OCR_MIN_WORD_CONFIDENCE:
+            continue
+        left, top = data["left"][i], data["top"][i]
+        words.append({
+            "text": text,
+            "x0": round(left * scale, 2),
+            "top": round(top * scale, 2),
+            "x1": round((left + data["width"][i]) * scale, 2),
+            "bottom": round((top + data["height"][i]) * scale, 2),
+            "conf": confidence,
+        })
+    return words
+
+
+def ocr_page(pdf_path: str, page_num: int) -> Dict:
+    """
+    OCR one page (1-based) and rebuild its rows.
+    Runs inside pool workers, so it opens its own handle on the PDF.
+    Returns {"text", "rows", "row_boxes", "cached", "error"}.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        page = pdf.pages[page_num - 1]
+        page_hash = page_image_hash(page)
+        words = load_cached_words(page_hash)
+        cached = words is not None
+
+        if words is None:
+            if not ocr_available():
+                return {"text": "", "rows": [], "row_boxes": [], "cached": False,
+                        "error": "Tesseract not available (pip install pytesseract + tesseract binary)"}
+            words = run_tesseract(page)
+            save_cached_words(page_hash, words)
+
+        rows, row_boxes, text = rebuild_rows(words)
+        return {"text": text, "rows": rows, "row_boxes": row_boxes, "cached": cached, "error": None}
+
+
+# =============================================================================
+# ROW REBUILDING
+# =============================================================================
+
+def group_lines(words: List[Dict]) -> List[List[Dict]]:
+    """Group words into lines by vertical centre, each line sorted left to right"""
+    if not words:
+        return []
+
+    line_height = statistics.median(w["bottom"] - w["top"] for w in words)
+    lines = []
+    current = []
+    current_centre = None
+
+    for word in sorted(words, key=lambda w: (w["top"] + w["bottom"]) / 2):
+        centre = (word["top"] + word["bottom"]) / 2
+        if current and abs(centre - current_centre) > line_height / 2:
+            lines.append(sorted(current, key=lambda w: w["x0"]))
+            current = []
+        current.append(word)
+        current_centre = sum((w["top"] + w["bottom"]) / 2 for w in current) / len(current)
+
+    if current:
+        lines.append(sorted(current, key=lambda w: w["x0"]))
+    return lines
+
+
+def split_cells(line: List[Dict]) -> List[Dict]:
+    """Join a line's words into cells, breaking at wide gaps"""
+    max_gap = CELL_GAP_RATIO * statistics.median(w["bottom"] - w["top"] for w in line)
+    cells = []
+    for word in line:
+        if cells and word["x0"] - cells[-1]["x1"] <= max_gap:
+            cells[-1]["text"] += " " + word["text"]
+            cells[-1]["x1"] = max(cells[-1]["x1"], word["x1"])
+        else:
+            cells.append({"text": word["text"], "x0": word["x0"], "x1": word["x1"]})
+    return cells
+
+
+def merge_spans(spans: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def find_columns(cell_lines: List[List[Dict]]) -> List[Tuple[float, float]]:
+    """Column x ranges shared by enough multi-cell lines (see module docstring)"""
+    table_lines = [cells for cells in cell_lines if len(cells) >= 2]
+    if not table_lines:
+        return []
+
+    # Coverage histogram at 1pt resolution, each line counted once per x
+    width = int(max(cell["x1"] for cells in table_lines for cell in cells)) + 2
+    coverage = [0] * width
+    for cells in table_lines:
+        covered = set()
+        for cell in cells:
+            covered.update(range(int(cell["x0"]), int(cell["x1"]) + 1))
+        for x in covered:
+            coverage[x] += 1
+
+    support = max(2, COLUMN_SUPPORT * len(table_lines))
+    columns = []
+    start = None
+    for x, count in enumerate(coverage + [0]):
+        if count >= support and start is None:
+            start = x
+        elif count < support and start is not None:
+            columns.append((float(start), float(x - 1)))
+            start = None
+
+    # Cells that fall between or outside every column open their own
+    orphans = [
+        (cell["x0"], cell["x1"])
+        for cells in cell_lines for cell in cells
+        if not any(overlap(cell, column) > 0 for column in columns)
+    ]
+    return merge_spans(columns + orphans)
+
+
+def overlap(cell: Dict, column: Tuple[float, float]) -> float:
+    return min(cell["x1"], column[1]) - max(cell["x0"], column[0])
+
+
+def rebuild_rows(words: List[Dict]) -> Tuple[List[List[str]], List[List[float]], str]:
+    """
+    Turn OCR word boxes into (table rows, row bboxes, page text).
+    Rows are lists of cell strings aligned to the page's columns, like
+    pdfplumber's extract_tables() output.
+    """
+    lines = group_lines(words)
+    text = "\n".join(" ".join(w["text"] for w in line) for line in lines)
+    cell_lines = [split_cells(line) for line in lines]
+    columns = find_columns(cell_lines)
+    if not columns:
+        return [], [], text
+
+    rows = []
+    row_boxes = []
+    for line, cells in zip(lines, cell_lines):
+        row = [""] * len(columns)
+        for cell in cells:
+            index = max(range(len(columns)), key=lambda i: overlap(cell, columns[i]))
+            row[index] = f"{row[index]} {cell['text']}".strip()
+        rows.append(row)
+        row_boxes.append([min(w["x0"] for w in line), min(w["top"] for w in line),
+                          max(w["x1"] for w in line), max(w["bottom"] for w in line)])
+    return rows, row_boxes, text
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+def fill_scanned_pages(pages: Iterable[Tuple], pdf_path: str, workers: int = OCR_WORKERS) -> Iterator[Tuple]:
+    """
+    Pass extracted (page_num, page_text, tables, row_bboxes, scanned) pages
+    through in order, replacing scanned pages with their OCR'd text and rows.
+
+    Scanned pages are OCR'd in a process pool while later pages keep being
+    extracted; up to 2 pages per worker are in flight. The pool is only
+    started once a scanned page turns up; with workers <= 1 (e.g. inside
+    another pool's worker) pages are OCR'd in-process.
+    """
+    pool = None
+    pending = deque()  # (page, OCR result / future / None), in page order
+    skipped = []
+
+    def resolve(page: Tuple, ocr) -> Tuple:
+        if ocr is None:
+            return page
+        result = ocr if isinstance(ocr, dict) else ocr.result()
+        if result["error"]:
+            if not skipped:
+                print(f"    Warning: scanned pages can't be OCR'd: {result['error']}")
+            skipped.append(page[0])
+            return page
+        tables = [result["rows"]] if result["rows"] else []
+        return page[0], result["text"], tables, [result["row_boxes"]], True
+
+    def ready(ocr) -> bool:
+        return ocr is None or isinstance(ocr, dict) or ocr.done()
+
+    try:
+        for page in pages:
+            ocr = None
+            if page[4]:
+                if workers <= 1:
+                    ocr = ocr_page(pdf_path, page[0])
+                else:
+                    if pool is None:
+                        pool = ProcessPoolExecutor(max_workers=workers)
+                    ocr = pool.submit(ocr_page, pdf_path, page[0])
+            pending.append((page, ocr))
+
+            while pending and (len(pending) > workers * 2 or ready(pending[0][1])):
+                yield resolve(*pending.popleft())
+
+        while pending:
+            yield resolve(*pending.popleft())
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if skipped:
+            print(f"    Skipped {len(skipped)} scanned pages: {skipped[:10]}")
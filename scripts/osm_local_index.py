@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Local OSM Spatial Index
+Offline answers for road access and amenity distances, built once from a
+county or state OpenStreetMap extract (.osm.pbf, e.g. from Geofabrik) instead
+of one Overpass request per property:
+
+- Amenity nodes (AMENITY_TYPES) go into one KD-tree per amenity type, over
+  unit-sphere coordinates so the nearest neighbour is the nearest by
+  great-circle distance
+- Roads (ways tagged highway=*) go into an STRtree; distances to candidate
+  roads are measured in a local projection around each property
+
+The index is pickled under OSM_INDEX_DIR and reloads in well under a second.
+Building requires pyosmium; querying requires scipy and shapely (optional
+dependencies; `pip install osmium scipy shapely`).
+
+Usage:
+    python osm_local_index.py build pennsylvania-latest.osm.pbf --name blair \\
+        --bbox -78.62,40.28,-78.12,40.74
+    python osm_local_index.py query blair --latitude 40.5186 --longitude -78.3947
+
+    python osm_access_analyzer.py --county Blair --state PA --osm-index blair
+    python neighborhood_enrichment.py --county Blair --state PA --osm-index blair
+"""
+
+import argparse
+import math
+import os
+import pickle
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Add scripts directory to path to import shared modules
+sys.path.insert(0, str(Path(__file__).parent))
+from geo import EARTH_RADIUS_METERS, nearest_on_polylines
+
+try:
+    import osmium
+except ImportError:  # Optional dependency - needed only to build an index
+    osmium = None
+
+try:
+    import shapely
+    from scipy.spatial import cKDTree
+except ImportError:  # Optional dependencies - the local index is unavailable without them
+    shapely = None
+
+OSM_INDEX_DIR = Path(os.getenv("OSM_INDEX_DIR", str(Path(__file__).parent / ".cache" / "osm")))
+
+# Bump when the pickled layout changes
+OSM_INDEX_VERSION = 1
+
+# Amenity type -> (OSM tag key, tag value, search radius in meters)
+AMENITY_TYPES = {
+    'grocery': ('shop', 'supermarket', 8000),
+    'hospital': ('amenity', 'hospital', 16000),
+    'shopping': ('shop', 'mall', 16000),
+    'park': ('leisure', 'park', 8000),
+    'school': ('amenity', 'school', 8000),
+}
+
+
+def index_available() -> bool:
+    return shapely is not None
+
+
+def index_path(name: str) -> Path:
+    """An index name resolves to OSM_INDEX_DIR/<name>.pkl; a path is used as is"""
+    path = Path(name)
+    if path.suffix == ".pkl" or path.parent != Path("."):
+        return path
+    return OSM_INDEX_DIR / f"{name}.pkl"
+
+
+def unit_vectors(lats, lons) -> np.ndarray:
+    """Points on the unit sphere; chord length grows with great-circle distance"""
+    lats = np.radians(np.asarray(lats, dtype=float))
+    lons = np.radians(np.asarray(lons, dtype=float))
+    return np.column_stack([np.cos(lats) * np.cos(lons), np.cos(lats) * np.sin(lons), np.sin(lats)])
+
+
+def chord_to_meters(chord):
+    return 2 * EARTH_RADIUS_METERS * np.arcsin(np.minimum(np.asarray(chord) / 2, 1.0))
+
+
+def meters_to_chord(meters: float) -> float:
+    return 2 * math.sin(min(meters / EARTH_RADIUS_METERS, math.pi) / 2)
+
+
+def road_info(highway: str, name: str, access: str, distance: float,
+              near_lat: float, near_lon: float, bearing: float) -> Dict:
+    """A road near a property, as analyze_road_access classifies it"""
+    return {
+        'type': highway,
+        'name': name,
+        'distance': distance,
+        'access': access,
+        'nearest_point': (near_lat, near_lon),
+        'bearing': None if math.isnan(bearing) else bearing
+    }
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+class ExtractHandler(osmium.SimpleHandler if osmium else object):
+    """Collects amenity nodes and highway ways from an OSM extract"""
+
+    def __init__(self, bbox: Optional[Tuple[float, float, float, float]] = None):
+        super().__init__()
+        self.bbox = bbox
+        self.amenities = {amenity_type: [] for amenity_type in AMENITY_TYPES}
+        self.roads = []  # (lon/lat coordinate array, highway, name, access)
+
+    def in_bbox(self, lon: float, lat: float) -> bool:
+        if not self.bbox:
+            return True
+        min_lon, min_lat, max_lon, max_lat = self.bbox
+        return min_lon <= lon <= max_lon and min_lat <= lat <= max_lat
+
+    def node(self, n):
+        if not n.location.valid() or not self.in_bbox(n.location.lon, n.location.lat):
+            return
+        for amenity_type, (key, value, _) in AMENITY_TYPES.items():
+            if n.tags.get(key) == value:
+                self.amenities[amenity_type].append((n.location.lat, n.location.lon))
+
+    def way(self, w):
+        highway = w.tags.get('highway')
+        if not highway:
+            return
+        coords = [(node.lon, node.lat) for node in w.nodes if node.location.valid()]
+        if len(coords) < 2 or not any(self.in_bbox(lon, lat) for lon, lat in coords):
+            return
+        self.roads.append((np.array(coords), highway, w.tags.get('name', 'Unnamed'),
+                           w.tags.get('access', 'public')))
+
+
+def build_index(pbf_path: str, name: str, bbox: Optional[Tuple[float, float, float, float]] = None) -> Path:
+    """Read an OSM extract (optionally clipped to bbox) and save its index as `name`"""
+    if osmium is None:
+        raise ImportError("Building an OSM index requires pyosmium (pip install osmium)")
+
+    started = time.perf_counter()
+    handler = ExtractHandler(bbox)
+    handler.apply_file(str(pbf_path), locations=True)
+
+    data = {
+        'version': OSM_INDEX_VERSION,
+        'source': str(pbf_path),
+        'bbox': bbox,
+        'built_at': time.time(),
+        'amenities': {amenity_type: np.array(points, dtype=float).reshape(-1, 2)
+                      for amenity_type, points in handler.amenities.items()},
+        # Road vertices flattened, with the road each vertex belongs to
+        'road_coords': np.concatenate([coords for coords, *_ in handler.roads]) if handler.roads
+                       else np.empty((0, 2)),
+        'road_index': np.repeat(np.arange(len(handler.roads)), [len(coords) for coords, *_ in handler.roads]),
+        'road_tags': [(highway, road_name, access) for _, highway, road_name, access in handler.roads],
+    }
+
+    path = index_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    amenity_count = sum(len(points) for points in data['amenities'].values())
+    print(f"   Indexed {amenity_count} amenities and {len(handler.roads)} roads "
+          f"in {time.perf_counter() - started:.1f}s -> {path}")
+    return path
+
+
+# =============================================================================
+# QUERY
+# =============================================================================
+
+class OsmIndex:
+    """In-memory amenity KD-trees and road STRtree loaded from a saved index"""
+
+    def __init__(self, data: Dict):
+        if shapely is None:
+            raise ImportError("The local OSM index requires scipy and shapely (pip install scipy shapely)")
+        self.source = data['source']
+        self.amenity_trees = {
+            amenity_type: cKDTree(unit_vectors(points[:, 0], points[:, 1]))
+            for amenity_type, points in data['amenities'].items() if len(points)
+        }
+        if len(data['road_coords']):
+            self.roads = shapely.linestrings(data['road_coords'], indices=data['road_index'])
+        else:
+            self.roads = np.empty(0, dtype=object)
+        self.road_tags = data['road_tags']
+        self.road_tree = shapely.STRtree(self.roads)
+
+    @classmethod
+    def load(cls, name: str) -> "OsmIndex":
+        path = index_path(name)
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data.get('version') != OSM_INDEX_VERSION:
+            raise ValueError(f"{path} was built by another version of osm_local_index.py; rebuild it")
+        return cls(data)
+
+    def amenity_distances(self, latitude: float, longitude: float) -> Dict[str, Optional[float]]:
+        """Meters to the nearest amenity of each type within its search radius (None if none)"""
+        point = unit_vectors([latitude], [longitude])[0]
+        distances = {}
+        for amenity_type, (_, _, radius) in AMENITY_TYPES.items():
+            tree = self.amenity_trees.get(amenity_type)
+            if tree is None:
+                distances[amenity_type] = None
+                continue
+            chord, _ = tree.query(point, distance_upper_bound=meters_to_chord(radius))
+            distances[amenity_type] = float(chord_to_meters(chord)) if np.isfinite(chord) else None
+        return distances
+
+    def roads_near(self, latitude: float, longitude: float, radius: float) -> List[Dict]:
+        """Roads within radius meters, as road_info dicts"""
+        lat_degrees = radius / EARTH_RADIUS_METERS * 180 / math.pi
+        lon_degrees = lat_degrees / max(math.cos(math.radians(latitude)), 1e-6)
+        box = shapely.box(longitude - lon_degrees, latitude - lat_degrees,
+                          longitude + lon_degrees, latitude + lat_degrees)
+        candidates = self.road_tree.query(box)
+        if not len(candidates):
+            return []
+
+        # Nearest point on each candidate road, over all its segments
+        coords, candidate_ids = shapely.get_coordinates(self.roads[candidates], return_index=True)
+        found, distances, near_lats, near_lons, bearings = nearest_on_polylines(
+            latitude, longitude, coords[:, 1], coords[:, 0], candidate_ids
+        )
+
+        roads = []
+        for candidate, distance, near_lat, near_lon, bearing in zip(
+                found.tolist(), distances.tolist(), near_lats.tolist(), near_lons.tolist(), bearings.tolist()):
+            if distance <= radius:
+                highway, name, access = self.road_tags[candidates[candidate]]
+                roads.append(road_info(highway, name, access, distance, near_lat, near_lon, bearing))
+        return roads
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query a local OSM spatial index')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build = subparsers.add_parser('build', help='Index an OSM extract (.osm.pbf)')
+    build.add_argument('pbf', help='OSM extract, e.g. pennsylvania-latest.osm.pbf')
+    build.add_argument('--name', required=True, help=f'Index name (saved to {OSM_INDEX_DIR}/<name>.pkl) or path')
+    build.add_argument('--bbox', help='Clip to min_lon,min_lat,max_lon,max_lat')
+
+    query = subparsers.add_parser('query', help='Road access and amenity distances for a point')
+    query.add_argument('index', help='Index name or path')
+    query.add_argument('--latitude', type=float, required=True)
+    query.add_argument('--longitude', type=float, required=True)
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        bbox = tuple(float(value) for value in args.bbox.split(',')) if args.bbox else None
+        if bbox and len(bbox) != 4:
+            parser.error('--bbox takes min_lon,min_lat,max_lon,max_lat')
+        if osmium is None:
+            sys.exit("pyosmium is not installed (pip install osmium)")
+        build_index(args.pbf, args.name, bbox)
+        return
+
+    if not index_available():
+        sys.exit("scipy and shapely are not installed (pip install scipy shapely)")
+
+    # Imported here: osm_access_analyzer imports this module
+    from osm_access_analyzer import analyze_road_access
+
+    started = time.perf_counter()
+    index = OsmIndex.load(args.index)
+    print(f"Loaded {index_path(args.index)} in {time.perf_counter() - started:.2f}s")
+
+    started = time.perf_counter()
+    access = analyze_road_access(args.latitude, args.longitude, index)
+    amenities = index.amenity_distances(args.latitude, args.longitude)
+    print(f"Answered in {(time.perf_counter() - started) * 1000:.2f}ms")
+    print(f"   Road access: {access['road_access_type']}, {access['distance_to_public_road']}m "
+          f"({access['nearest_road_name']})")
+    for amenity_type, distance in amenities.items():
+        print(f"   {amenity_type}: {f'{distance:.0f}m' if distance is not None else 'none in range'}")
+
+
+if __name__ == "__main__":
+    main()
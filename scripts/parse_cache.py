@@ -0,0 +1,112 @@
+"""
+Parse Result Cache
+Persists extracted property rows per (PDF sha256, parser version, state_code, sale_type)
+so re-running a parser on an unchanged PDF skips pdfplumber entirely.
+
+Rows are streamed to disk as they are parsed (gzipped msgpack when installed,
+otherwise gzipped JSON lines) and the entry is only committed once the whole
+document has been parsed. Because the parser version is part of the key,
+entries written by an older parser are never read again.
+
+Usage:
+    cache = ParseCache()
+    key = cache.key(file_sha256(pdf_path), PARSER_VERSION, 'PA', 'upset')
+    rows = cache.load(key)
+    if rows is None:
+        rows = cache.store(key, parse_rows(...))
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+try:
+    import msgpack
+except ImportError:  # Optional dependency - fall back to gzipped JSON lines
+    msgpack = None
+
+PARSE_CACHE_DIR = Path(os.getenv("PARSE_CACHE_DIR", str(Path(__file__).parent / ".cache" / "parses")))
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path) -> str:
+    """sha256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_fingerprint(*paths) -> str:
+    """Short hash of source files, so editing a parser invalidates its cache entries"""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+class ParseCache:
+    """On-disk cache of parsed property rows"""
+
+    def __init__(self, cache_dir: Path = PARSE_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.suffix = ".msgpack.gz" if msgpack else ".jsonl.gz"
+
+    @staticmethod
+    def key(pdf_sha256: str, parser_version: str, state_code: str, sale_type: Optional[str]) -> str:
+        raw = "|".join([pdf_sha256, parser_version, state_code or "", sale_type or ""])
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def load(self, key: str) -> Optional[Iterator[Dict]]:
+        """Return an iterator over cached rows, or None on a miss"""
+        path = self.path(key)
+        if not path.exists():
+            return None
+        return self._read(path)
+
+    def _read(self, path: Path) -> Iterator[Dict]:
+        if msgpack:
+            with gzip.open(path, "rb") as f:
+                yield from msgpack.Unpacker(f, raw=False)
+        else:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    yield json.loads(line)
+
+    def store(self, key: str, rows: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Pass rows through while writing them to the cache.
+        The entry is committed only if rows is fully consumed; a partial
+        parse (error or early stop) leaves no entry behind.
+        """
+        path = self.path(key)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        committed = False
+
+        try:
+            if msgpack:
+                packer = msgpack.Packer()
+                with gzip.open(tmp_path, "wb") as f:
+                    for row in rows:
+                        f.write(packer.pack(row))
+                        yield row
+            else:
+                with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                    for row in rows:
+                        f.write(json.dumps(row, default=str) + "\n")
+                        yield row
+            os.replace(tmp_path, path)
+            committed = True
+        finally:
+            if not committed:
+                tmp_path.unlink(missing_ok=True)
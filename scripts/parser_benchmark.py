@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Parser Benchmark Suite
+Runs universal_parser.parse_pdf and parse_blair_county.parse_pdf over a corpus
+of county PDFs and reports speed, memory and accuracy as JSON.
+
+For every document x parser it reports:
+- pages/sec and rows/sec
+- peak RSS (each run is a separate process, so memory is not shared)
+- stage timings: page parsing (pdfminer character/layout objects), text
+  extraction, table extraction, row parsing (the rest)
+- accuracy against the document's golden JSON (parcel recall/precision and
+  per-field agreement); a golden file the manifest names but that doesn't
+  exist fails the run (exit 1) unless --write-golden or --no-accuracy is given.
+  Documents without a "golden" key are timed only; add one once its golden
+  JSON has been checked by hand against the PDF (--write-golden only copies
+  the current parser's output, so it can't be the reference by itself).
+
+The corpus manifest (default: fixtures/parser_corpus.json) lists documents:
+
+    {"documents": [{
+        "name": "blair-upset",
+        "url": "https://...",            # fetched through the PDF cache, or
+        "pdf": "pdfs/upset.pdf",         # a local file (relative to the manifest)
+        "state": "PA", "sale_type": "upset", "sale_date": "2025-09-17 09:00:00",
+        "parsers": ["universal", "blair"],
+        "golden": "golden/blair-upset.json"
+    }]}
+
+Usage:
+    python parser_benchmark.py
+    python parser_benchmark.py --output bench.json --baseline previous.json
+    python parser_benchmark.py --manifest my_corpus.json --write-golden
+    python parser_benchmark.py --no-accuracy
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows - peak RSS is reported as null
+    resource = None
+
+# Add scripts directory to path to import shared modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+DEFAULT_MANIFEST = Path(__file__).parent / "fixtures" / "parser_corpus.json"
+PARSERS = ["universal", "blair"]
+
+# Fields compared against golden output for rows whose parcel_id matches
+ACCURACY_FIELDS = ['address', 'owner', 'city', 'total_due']
+
+# --baseline flags a run this much slower (pages/sec) or less accurate
+REGRESSION_SLOWDOWN = 0.10
+REGRESSION_ACCURACY_DROP = 0.005
+
+
+# =============================================================================
+# SINGLE RUN (child process)
+# =============================================================================
+
+class StageTimer:
+    """
+    Accumulates time spent inside pdfplumber, split into stages.
+    Time is exclusive: character parsing triggered from inside find_tables()
+    counts as page_parsing, not table_extraction.
+    """
+
+    def __init__(self):
+        self.seconds = {'page_parsing': 0.0, 'text_extraction': 0.0, 'table_extraction': 0.0}
+        self._nested: List[float] = []
+
+    def wrap(self, owner, name: str, stage: str) -> None:
+        original = getattr(owner, name)
+
+        def timed(*args, **kwargs):
+            self._nested.append(0.0)
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.seconds[stage] += elapsed - self._nested.pop()
+                if self._nested:
+                    self._nested[-1] += elapsed
+
+        setattr(owner, name, timed)
+
+    def install(self) -> "StageTimer":
+        # extract_tables() is find_tables() + Table.extract(), so it is counted through those
+        from pdfplumber.page import Page
+        from pdfplumber.table import Table
+        self.wrap(Page, 'parse_objects', 'page_parsing')
+        self.wrap(Page, 'extract_text', 'text_extraction')
+        self.wrap(Page, 'find_tables', 'table_extraction')
+        self.wrap(Table, 'extract', 'table_extraction')
+        return self
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def run_one(spec: Dict) -> Dict:
+    """Parse one document with one parser and measure it (runs in its own process)"""
+    import pdfplumber
+
+    import universal_parser
+    import parse_blair_county
+
+    with pdfplumber.open(spec['pdf']) as pdf:
+        page_count = len(pdf.pages)
+
+    layout_key = f"benchmark-{spec['name']}" if spec['layout'] else None
+    if layout_key:
+        # Learn the layout profile first so the timed run uses it
+        with redirect_stdout(io.StringIO()):
+            universal_parser.parse_pdf(spec['pdf'], spec['state'], spec['sale_type'], spec['sale_date'],
+                                       1, False, False, layout_key)
+
+    rss_before = peak_rss_mb()
+    timer = StageTimer().install()
+    start = time.perf_counter()
+
+    with redirect_stdout(io.StringIO()):
+        if spec['parser'] == 'universal':
+            properties = universal_parser.parse_pdf(
+                spec['pdf'], spec['state'], spec['sale_type'], spec['sale_date'],
+                spec['workers'], False, False, layout_key
+            )
+        else:
+            properties = parse_blair_county.parse_pdf(spec['pdf'], spec['sale_type'], spec['sale_date'])
+
+    elapsed = time.perf_counter() - start
+    stages = {name: round(seconds, 4) for name, seconds in timer.seconds.items()}
+    stages['row_parsing'] = round(max(0.0, elapsed - sum(timer.seconds.values())), 4)
+
+    return {
+        'pages': page_count,
+        'rows': len(properties),
+        'seconds': round(elapsed, 4),
+        'pages_per_sec': round(page_count / elapsed, 2) if elapsed else None,
+        'rows_per_sec': round(len(properties) / elapsed, 2) if elapsed else None,
+        'peak_rss_mb': peak_rss_mb(),
+        'baseline_rss_mb': rss_before,
+        'stages': stages,
+        'properties': json.loads(json.dumps(properties, default=str)),
+    }
+
+
+# =============================================================================
+# ACCURACY
+# =============================================================================
+
+def score_accuracy(properties: List[Dict], golden: List[Dict]) -> Dict:
+    """Compare parsed rows with golden rows, matching on parcel_id"""
+    found = Counter(p.get('parcel_id') for p in properties)
+    expected = Counter(g.get('parcel_id') for g in golden)
+    matched = sum((found & expected).values())
+
+    by_parcel = {}
+    for prop in properties:
+        by_parcel.setdefault(prop.get('parcel_id'), prop)
+
+    fields_compared = 0
+    fields_equal = 0
+    mismatches = []
+    for row in golden:
+        prop = by_parcel.get(row.get('parcel_id'))
+        if not prop:
+            continue
+        for field in ACCURACY_FIELDS:
+            if field not in row:
+                continue
+            fields_compared += 1
+            if prop.get(field) == row[field]:
+                fields_equal += 1
+            elif len(mismatches) < 10:
+                mismatches.append({'parcel_id': row.get('parcel_id'), 'field': field,
+                                   'expected': row[field], 'actual': prop.get(field)})
+
+    return {
+        'golden_rows': len(golden),
+        'parcel_recall': round(matched / len(golden), 4) if golden else None,
+        'parcel_precision': round(matched / len(properties), 4) if properties else None,
+        'field_accuracy': round(fields_equal / fields_compared, 4) if fields_compared else None,
+        'missing': sorted((expected - found).elements())[:10],
+        'unexpected': sorted((found - expected).elements())[:10],
+        'field_mismatches': mismatches,
+    }
+
+
+def golden_rows(properties: List[Dict]) -> List[Dict]:
+    """The stable part of parsed rows (drops tax_year, raw_text, ...)"""
+    return [{field: prop.get(field) for field in ['parcel_id'] + ACCURACY_FIELDS} for prop in properties]
+
+
+# =============================================================================
+# CORPUS RUN
+# =============================================================================
+
+def resolve_pdf(document: Dict, manifest_dir: Path, cache) -> Optional[str]:
+    if document.get('pdf'):
+        path = manifest_dir / document['pdf']
+        if path.exists():
+            return str(path)
+    if document.get('url'):
+        if cache is None:
+            return None
+        return str(cache.fetch(document['url']))
+    return None
+
+
+def run_child(spec: Dict, layout_dir: str) -> Dict:
+    result = subprocess.run(
+        [sys.executable, __file__, '--run-one', json.dumps(spec)],
+        capture_output=True, text=True, env=dict(os.environ, LAYOUT_PROFILE_DIR=layout_dir)
+    )
+    if result.returncode != 0:
+        return {'error': result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'failed'}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def compare_baseline(results: List[Dict], baseline_path: str) -> List[str]:
+    """Regressions against a previous --output file"""
+    with open(baseline_path) as f:
+        baseline = {(r['document'], r['parser']): r for r in json.load(f)['results']}
+
+    regressions = []
+    for result in results:
+        before = baseline.get((result['document'], result['parser']))
+        if not before or 'error' in result or 'error' in before:
+            continue
+        if before.get('pages_per_sec') and result.get('pages_per_sec'):
+            change = result['pages_per_sec'] / before['pages_per_sec'] - 1
+            if change < -REGRESSION_SLOWDOWN:
+                regressions.append(f"{result['document']}/{result['parser']}: pages/sec {change:+.0%}")
+        for metric in ['parcel_recall', 'parcel_precision', 'field_accuracy']:
+            old = (before.get('accuracy') or {}).get(metric)
+            new = (result.get('accuracy') or {}).get(metric)
+            if old is not None and new is not None and new < old - REGRESSION_ACCURACY_DROP:
+                regressions.append(f"{result['document']}/{result['parser']}: {metric} {old} -> {new}")
+    return regressions
+
+
+def environment_info() -> Dict:
+    import pdfplumber
+    from universal_parser import PARSER_CACHE_VERSION
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=Path(__file__).parent).stdout.strip() or None
+    except OSError:
+        commit = None
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': commit,
+        'parser_version': PARSER_CACHE_VERSION,
+        'python': platform.python_version(),
+        'pdfplumber': pdfplumber.__version__,
+        'platform': platform.platform(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the PDF parsers over a corpus')
+    parser.add_argument('--manifest', default=str(DEFAULT_MANIFEST), help='Corpus manifest JSON')
+    parser.add_argument('--only', action='append', help='Only run documents with this name (repeatable)')
+    parser.add_argument('--parser', choices=PARSERS, action='append', help='Only run this parser (repeatable)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='universal_parser page workers (stage timings need 1)')
+    parser.add_argument('--layout', action='store_true',
+                        help='Run universal_parser with a learned layout profile')
+    parser.add_argument('--no-fetch', action='store_true', help="Skip documents that aren't available locally")
+    parser.add_argument('--write-golden', action='store_true',
+                        help='Write golden JSON from universal_parser output where it is missing')
+    parser.add_argument('--no-accuracy', action='store_true',
+                        help='Skip accuracy scoring (missing golden files are not an error)')
+    parser.add_argument('--output', help='Write results JSON to this file')
+    parser.add_argument('--baseline', help='Previous --output file to check for regressions')
+    parser.add_argument('--run-one', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_one(json.loads(args.run_one))))
+        return
+
+    manifest_path = Path(args.manifest)
+    with open(manifest_path) as f:
+        documents = json.load(f)['documents']
+
+    cache = None
+    if not args.no_fetch:
+        from pdf_cache import PdfCache
+        cache = PdfCache()
+
+    print("Parser Benchmark")
+    print("=" * 60)
+
+    results = []
+    missing_golden = []
+    with tempfile.TemporaryDirectory() as layout_dir:
+        for document in documents:
+            if args.only and document['name'] not in args.only:
+                continue
+
+            pdf_path = resolve_pdf(document, manifest_path.parent, cache)
+            if not pdf_path:
+                print(f"\n{document['name']}: PDF not available, skipping")
+                continue
+
+            golden_path = manifest_path.parent / document['golden'] if document.get('golden') else None
+            golden = None
+            if args.no_accuracy:
+                golden_path = None
+            elif golden_path and golden_path.exists():
+                with open(golden_path) as f:
+                    golden = json.load(f)
+
+            print(f"\n{document['name']}")
+            if golden_path and golden is None and not args.write_golden:
+                print(f"   ❌ Golden output missing: {golden_path}")
+                missing_golden.append(str(golden_path))
+            for parser_name in document.get('parsers', ['universal']):
+                if args.parser and parser_name not in args.parser:
+                    continue
+
+                spec = {
+                    'name': document['name'],
+                    'pdf': pdf_path,
+                    'parser': parser_name,
+                    'state': document.get('state', 'PA'),
+                    'sale_type': document.get('sale_type'),
+                    'sale_date': document.get('sale_date'),
+                    'workers': args.workers,
+                    'layout': args.layout and parser_name == 'universal',
+                }
+                run = run_child(spec, layout_dir)
+                result = {'document': document['name'], 'parser': parser_name, **run}
+                properties = result.pop('properties', None)
+
+                if 'error' in result:
+                    print(f"   {parser_name:<10} ❌ {result['error']}")
+                    results.append(result)
+                    continue
+
+                if golden is not None:
+                    result['accuracy'] = score_accuracy(properties, golden)
+                elif args.write_golden and golden_path and parser_name == 'universal':
+                    golden_path.parent.mkdir(parents=True, exist_ok=True)
+                    with open(golden_path, 'w') as f:
+                        json.dump(golden_rows(properties), f, indent=2)
+                    print(f"   Wrote golden output to {golden_path} (check it by hand before committing)")
+
+                accuracy = result.get('accuracy') or {}
+                stages = result['stages']
+                print(f"   {parser_name:<10} {result['pages']} pages, {result['rows']} rows in {result['seconds']:.2f}s "
+                      f"({result['pages_per_sec']} pages/s, {result['rows_per_sec']} rows/s, "
+                      f"peak RSS {result['peak_rss_mb']} MB)")
+                print(f"   {'':<10} page parsing {stages['page_parsing']:.2f}s, text {stages['text_extraction']:.2f}s, "
+                      f"tables {stages['table_extraction']:.2f}s, "
+                      f"rows {stages['row_parsing']:.2f}s"
+                      + (f" | recall {accuracy['parcel_recall']}, precision {accuracy['parcel_precision']}, "
+                         f"fields {accuracy['field_accuracy']}" if accuracy else ""))
+                results.append(result)
+
+    report = {'environment': environment_info(), 'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    regressions = []
+    if args.baseline:
+        regressions = compare_baseline(results, args.baseline)
+        print(f"\nRegressions vs {args.baseline}: {len(regressions)}")
+        for line in regressions:
+            print(f"   ⚠️  {line}")
+
+    if missing_golden:
+        print(f"\nMissing golden files: {len(missing_golden)} (create them with --write-golden "
+              f"or skip accuracy with --no-accuracy)")
+        for path in missing_golden:
+            print(f"   ❌ {path}")
+
+    if regressions or missing_golden:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Parser Micro-benchmark
+Times the per-cell hot paths of universal_parser.py against their previous
+implementations and checks that both return identical results.
+
+Currently covers:
+- parse_parcel_id (compiled per-state ParcelMatcher vs. per-call pattern list)
+- clean_spaced_text / clean_spaced_address (single-pass tokenizer vs. regex passes),
+  also checked against the golden outputs in fixtures/text_normalize_golden.json
+
+Usage:
+    python parser_microbench.py
+    python parser_microbench.py --rows 50000 --state PA --cells 100000
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Add scripts directory to path to import shared modules
+sys.path.insert(0, str(Path(__file__).parent))
+from universal_parser import PARCEL_PATTERNS, parse_parcel_id
+from text_normalize import COMMON_FIRST_NAMES, clean_spaced_address, clean_spaced_text
+
+# Cells per generated row (roughly the width of an upset sale table)
+CELLS_PER_ROW = 6
+
+GOLDEN_TEXT_PATH = Path(__file__).parent / "fixtures" / "text_normalize_golden.json"
+
+
+# =============================================================================
+# PREVIOUS IMPLEMENTATIONS
+# =============================================================================
+
+def legacy_parse_parcel_id(value: str, state_code: str = 'PA') -> Optional[str]:
+    """parse_parcel_id as it was before the compiled matcher"""
+    if not value:
+        return None
+
+    clean_value = str(value).strip()
+
+    upper_value = clean_value.upper()
+    reject_patterns = ['TOWNSHIP', 'BOROUGH', 'CITY OF', 'CAMA', 'MAP NUMBER',
+                       'CONTROL', 'OWNER', 'DESCRIPTION', 'LAND USE']
+    if any(x in upper_value for x in reject_patterns):
+        return None
+
+    clean_value = re.sub(r'\s+', '', clean_value)
+
+    patterns = PARCEL_PATTERNS.get(state_code, []) + PARCEL_PATTERNS['DEFAULT']
+
+    for pattern in patterns:
+        match = re.search(pattern, clean_value)
+        if match:
+            return match.group(0)
+
+    return None
+
+
+def legacy_clean_spaced_text(text: str) -> str:
+    """clean_spaced_text as it was before the single-pass tokenizer"""
+    if not text:
+        return text
+
+    text = re.sub(r'\s+', ' ', text).strip()
+
+    words = text.split(' ')
+    result = []
+    i = 0
+
+    while i < len(words):
+        if len(words[i]) == 1 and words[i].isupper():
+            single_letters = [words[i]]
+            j = i + 1
+            while j < len(words) and len(words[j]) == 1 and words[j].isupper():
+                single_letters.append(words[j])
+                j += 1
+
+            if len(single_letters) >= 2:
+                combined = ''.join(single_letters)
+
+                if j < len(words):
+                    next_word = words[j]
+                    if (len(next_word) >= 2 and len(next_word) <= 10 and
+                        next_word.isupper() and next_word not in COMMON_FIRST_NAMES):
+                        combined += next_word
+                        j += 1
+
+                result.append(combined)
+                i = j
+            else:
+                result.append(words[i])
+                i += 1
+        else:
+            result.append(words[i])
+            i += 1
+
+    text = ' '.join(result)
+    text = re.sub(r'\b([A-Z]) ([A-Z]{5,})(?=\s|$)', r'\1\2', text)
+
+    return text
+
+
+def legacy_clean_spaced_address(text: str) -> str:
+    """clean_spaced_address as it was before the single-pass tokenizer"""
+    if not text:
+        return text
+
+    text = re.sub(r'\s+', ' ', text).strip()
+
+    def fix_spaced_numbers(match):
+        return match.group(0).replace(' ', '')
+
+    text = re.sub(r'^(\d )+\d{1,2}(?=\s)', fix_spaced_numbers, text)
+
+    match = re.match(r'^(\d(\s\d)+)', text)
+    if match:
+        spaced_num = match.group(0)
+        clean_num = spaced_num.replace(' ', '')
+        text = clean_num + text[len(spaced_num):]
+
+    text = legacy_clean_spaced_text(text)
+
+    return text.strip()
+
+
+# =============================================================================
+# CORPUS
+# =============================================================================
+
+def generate_cells(rows: int, seed: int = 42) -> List[str]:
+    """Cells shaped like real property list rows (parcels, owners, money, headers)"""
+    rng = random.Random(seed)
+    owners = ['B A R N ER DAVID W', 'SMITH JOHN & MARY', 'M ALICOAT RUTH', 'ESTATE OF JONES']
+    headers = ['ALLEGHENY TOWNSHIP', 'BOROUGH OF TYRONE', 'CONTROL #', 'OWNER NAME', 'LAND USE']
+    cells = []
+
+    for _ in range(rows):
+        cells.append(rng.choice([
+            f"{rng.randint(1, 99):02d}.{rng.randint(0, 99):02d}-{rng.randint(0, 99):02d}..-"
+            f"{rng.randint(0, 999):03d}.{rng.randint(0, 99):02d}-{rng.randint(0, 999):03d}",
+            f"{rng.randint(100, 999)}-{rng.randint(0, 999999):06d}",
+            f"{rng.randint(10, 99)} {rng.randint(10, 99)} {rng.randint(100, 9999)}",
+            str(rng.randint(10 ** 7, 10 ** 11)),
+            rng.choice(headers),
+        ]))
+        cells.append(rng.choice(owners))
+        cells.append(f"{rng.randint(1, 9999)} {rng.choice(['3RD AVE', 'MAIN ST', 'OAK DR'])}")
+        cells.append(f"${rng.randint(100, 20000):,}.{rng.randint(0, 99):02d}")
+        cells.append(f"{rng.randint(2018, 2025)}")
+        cells.append(rng.choice(['', 'RESIDENTIAL', 'VACANT LAND', '12-34-567']))
+
+    return cells
+
+
+def generate_text_cells(count: int, seed: int = 42) -> List[Tuple[str, str]]:
+    """(function name, cell) pairs: half owner names, half addresses, many spaced out"""
+    rng = random.Random(seed)
+    owners = ['B A R N ER DAVID W', 'M ALICOAT RUTH', 'B A C K M EIER', 'SMITH JOHN & MARY',
+              'H O L L A N D LINDA', 'ESTATE OF JONES', 'D ESCRIPTION', 'MILLER  ROBERT  E']
+    addresses = ['8 1 5 3RD AVE', '1 5 08 13TH ALY', '2 2 09 1/2 8TH AVE', '5 1 1 5TH AVE',
+                 '1200 PLEASANT VALLEY BLVD', '4 0 1 W ASHINGTON AVE', 'RR 2 BOX 45', 'M AIN ST']
+    cells = []
+    for _ in range(count // 2):
+        cells.append(('clean_spaced_text', rng.choice(owners)))
+        cells.append(('clean_spaced_address', rng.choice(addresses)))
+    return cells
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def time_per_row(func: Callable, cells: List[str], state_code: str, repeat: int) -> float:
+    """Best-of-repeat microseconds per row of CELLS_PER_ROW cells"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for cell in cells:
+            func(cell, state_code)
+        best = min(best, time.perf_counter() - start)
+    return best / (len(cells) / CELLS_PER_ROW) * 1e6
+
+
+def time_text_cells(funcs: Dict[str, Callable], cells: List[Tuple[str, str]], repeat: int) -> float:
+    """Best-of-repeat seconds to clean every cell"""
+    calls = [(funcs[name], cell) for name, cell in cells]
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for func, cell in calls:
+            func(cell)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def check_text_golden() -> int:
+    """Compare the cleaning functions with the golden corpus; returns mismatch count"""
+    with open(GOLDEN_TEXT_PATH) as f:
+        golden = json.load(f)
+
+    funcs = {'clean_spaced_text': clean_spaced_text, 'clean_spaced_address': clean_spaced_address}
+    mismatches = 0
+    for name, cases in golden.items():
+        for case in cases:
+            actual = funcs[name](case['input'])
+            if actual != case['expected']:
+                mismatches += 1
+                print(f"❌ {name}({case['input']!r}) = {actual!r}, expected {case['expected']!r}")
+    return mismatches
+
+
+def bench_parcel_ids(rows: int, state_code: str, repeat: int) -> None:
+    cells = generate_cells(rows)
+
+    mismatches = [c for c in cells if parse_parcel_id(c, state_code) != legacy_parse_parcel_id(c, state_code)]
+    if mismatches:
+        print(f"❌ {len(mismatches)} cells differ, e.g. {mismatches[:3]}")
+        sys.exit(1)
+
+    before = time_per_row(legacy_parse_parcel_id, cells, state_code, repeat)
+    after = time_per_row(parse_parcel_id, cells, state_code, repeat)
+
+    print(f"parse_parcel_id ({state_code}, {rows} rows x {CELLS_PER_ROW} cells, results identical)")
+    print(f"   before: {before:.2f} µs/row")
+    print(f"   after:  {after:.2f} µs/row")
+    print(f"   speedup: {before / after:.2f}x")
+
+
+def bench_text_cleaning(count: int, repeat: int) -> None:
+    if check_text_golden():
+        sys.exit(1)
+
+    legacy = {'clean_spaced_text': legacy_clean_spaced_text, 'clean_spaced_address': legacy_clean_spaced_address}
+    current = {'clean_spaced_text': clean_spaced_text, 'clean_spaced_address': clean_spaced_address}
+    cells = generate_text_cells(count)
+
+    mismatches = [c for c in cells if current[c[0]](c[1]) != legacy[c[0]](c[1])]
+    if mismatches:
+        print(f"❌ {len(mismatches)} cells differ, e.g. {mismatches[:3]}")
+        sys.exit(1)
+
+    before = time_text_cells(legacy, cells, repeat)
+    after = time_text_cells(current, cells, repeat)
+
+    print(f"clean_spaced_text/address ({len(cells)} cells, golden corpus + results identical)")
+    print(f"   before: {len(cells) / before:,.0f} cells/s")
+    print(f"   after:  {len(cells) / after:,.0f} cells/s")
+    print(f"   speedup: {before / after:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-benchmark universal_parser hot paths')
+    parser.add_argument('--rows', type=int, default=20000, help='Generated rows to time')
+    parser.add_argument('--state', default='PA', help='State code for parcel patterns')
+    parser.add_argument('--cells', type=int, default=100000, help='Owner/address cells to clean')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing runs (best is reported)')
+    args = parser.parse_args()
+
+    bench_parcel_ids(args.rows, args.state, args.repeat)
+    bench_text_cleaning(args.cells, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
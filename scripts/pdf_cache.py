@@ -0,0 +1,286 @@
+"""
+PDF Download Cache
+Content-addressed local cache for county property list PDFs.
+
+- Downloads are streamed to disk in chunks and stored as blobs/<sha256>.pdf
+- Repeat fetches send ETag/Last-Modified conditional requests (304 = reuse blob)
+- A URL validated within fresh_seconds is served without touching the network
+- Interrupted downloads resume with a Range request (guarded by If-Range)
+- Total blob size is capped; least recently used blobs are evicted first, and
+  blobs no URL points to any more (e.g. a URL's previous content) are deleted
+- Downloads use http_client's shared keep-alive session unless one is passed
+- Several processes can share a cache dir: index updates are made under a file
+  lock (index.json.lock) against the index as it is on disk
+
+Usage:
+    from pdf_cache import PdfCache
+    path = PdfCache().fetch(url)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+import requests
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows - the index is then only locked within a process
+    fcntl = None
+
+from http_client import session as shared_session
+
+# Cache configuration
+CACHE_DIR = Path(os.getenv("PDF_CACHE_DIR", str(Path(__file__).parent / ".cache" / "pdfs")))
+CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_MB", "2048")) * 1024 * 1024
+CACHE_FRESH_SECONDS = int(os.getenv("PDF_CACHE_FRESH_SECONDS", str(12 * 3600)))
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_TIMEOUT = 60
+
+
+class PdfCache:
+    """Content-addressed PDF cache with conditional requests, resume and an LRU size cap"""
+
+    def __init__(
+        self,
+        cache_dir: Path = CACHE_DIR,
+        max_bytes: int = CACHE_MAX_BYTES,
+        fresh_seconds: int = CACHE_FRESH_SECONDS,
+        session: Optional[requests.Session] = None
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.blob_dir = self.cache_dir / "blobs"
+        self.partial_dir = self.cache_dir / "partial"
+        self.index_path = self.cache_dir / "index.json"
+        self.lock_path = self.cache_dir / "index.json.lock"
+        self.max_bytes = max_bytes
+        self.fresh_seconds = fresh_seconds
+        self.session = session or shared_session
+
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.partial_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._index: Dict[str, Dict] = {}
+
+    # -------------------------------------------------------------------------
+    # Index
+    # -------------------------------------------------------------------------
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @contextmanager
+    def _locked_index(self) -> Iterator[Dict[str, Dict]]:
+        """
+        Reload the index from disk and hold it for a read-modify-write: other
+        threads are kept out by self._lock, other processes by an flock on
+        index.json.lock
+        """
+        with self._lock, open(self.lock_path, "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            self._index = self._load_index()
+            yield self._index
+
+    def _save_index(self) -> None:
+        """Write the index atomically (caller holds _locked_index)"""
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self._index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def _url_lock(self, url: str) -> threading.Lock:
+        with self._lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.blob_dir / f"{sha256}.pdf"
+
+    # -------------------------------------------------------------------------
+    # Fetch
+    # -------------------------------------------------------------------------
+
+    def fetch(self, url: str, refresh: bool = False) -> Path:
+        """Return a local path for url, downloading only if it changed"""
+        return self.fetch_with_status(url, refresh)[0]
+
+    def fetch_with_status(self, url: str, refresh: bool = False) -> Tuple[Path, str]:
+        """
+        Return (local path, status) for url.
+
+        status is one of:
+            'fresh'        - validated recently, no request sent
+            'not_modified' - server answered 304, cached blob reused
+            'downloaded'   - new or changed content was downloaded
+        """
+        with self._url_lock(url):
+            with self._locked_index() as index:
+                entry = dict(index.get(url) or {})
+
+            cached = self.blob_path(entry["sha256"]) if entry.get("sha256") else None
+            if cached and not cached.exists():
+                cached, entry = None, {}
+
+            if cached and not refresh and time.time() - entry.get("checked_at", 0) < self.fresh_seconds:
+                self._touch(url, checked=False)
+                return cached, "fresh"
+
+            headers = {}
+            if cached:
+                if entry.get("etag"):
+                    headers["If-None-Match"] = entry["etag"]
+                if entry.get("last_modified"):
+                    headers["If-Modified-Since"] = entry["last_modified"]
+
+            result = self._download(url, headers)
+            if result is None:
+                self._touch(url, checked=True)
+                return cached, "not_modified"
+
+            part_path, sha256, validators = result
+            with self._locked_index() as index:
+                path = self._store_blob(part_path, sha256)
+                index[url] = {
+                    "sha256": sha256,
+                    "size": path.stat().st_size,
+                    "etag": validators.get("etag"),
+                    "last_modified": validators.get("last_modified"),
+                    "checked_at": time.time(),
+                    "last_used": time.time(),
+                }
+                self._evict(keep=sha256)
+                self._save_index()
+            return path, "downloaded"
+
+    def _touch(self, url: str, checked: bool) -> None:
+        with self._locked_index() as index:
+            entry = index.get(url)
+            if entry:
+                entry["last_used"] = time.time()
+                if checked:
+                    entry["checked_at"] = time.time()
+                self._save_index()
+
+    def _download(self, url: str, headers: Dict[str, str]) -> Optional[Tuple[Path, str, Dict]]:
+        """
+        Stream url into a partial file, resuming a previous attempt if possible.
+        Returns None on 304, otherwise (completed partial file, sha256, validators).
+        """
+        key = hashlib.sha1(url.encode()).hexdigest()
+        part_path = self.partial_dir / f"{key}.part"
+        meta_path = self.partial_dir / f"{key}.json"
+
+        request_headers = dict(headers)
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        part_meta = self._read_json(meta_path) if offset else {}
+        validator = part_meta.get("etag") or part_meta.get("last_modified")
+        if offset and validator:
+            request_headers["Range"] = f"bytes={offset}-"
+            request_headers["If-Range"] = validator
+        else:
+            offset = 0
+
+        with self.session.get(url, headers=request_headers, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            if response.status_code == 304:
+                return None
+            if response.status_code == 416:
+                # Partial file no longer matches the remote; start over
+                self._discard_partial(part_path, meta_path)
+                return self._download(url, headers)
+            response.raise_for_status()
+
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+
+            digest = hashlib.sha256()
+            if response.status_code == 206 and offset:
+                mode = "ab"
+                with open(part_path, "rb") as f:
+                    for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                        digest.update(block)
+            else:
+                mode = "wb"
+
+            with open(meta_path, "w") as f:
+                json.dump(validators, f)
+
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    digest.update(chunk)
+
+        meta_path.unlink(missing_ok=True)
+        return part_path, digest.hexdigest(), validators
+
+    def _store_blob(self, part_path: Path, sha256: str) -> Path:
+        """
+        Move a completed download into blobs/ (caller holds _locked_index, so
+        a blob is never on disk without its index entry while any process's
+        _evict runs)
+        """
+        blob = self.blob_path(sha256)
+        if blob.exists():
+            part_path.unlink()
+        else:
+            os.replace(part_path, blob)
+        return blob
+
+    @staticmethod
+    def _read_json(path: Path) -> Dict:
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _discard_partial(part_path: Path, meta_path: Path) -> None:
+        part_path.unlink(missing_ok=True)
+        meta_path.unlink(missing_ok=True)
+
+    # -------------------------------------------------------------------------
+    # Eviction
+    # -------------------------------------------------------------------------
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """
+        Delete blobs no index entry points to, then least recently used blobs
+        until under max_bytes (caller holds _locked_index)
+        """
+        blobs: Dict[str, Dict] = {}
+        for url, entry in self._index.items():
+            blob = blobs.setdefault(entry["sha256"], {"size": entry.get("size", 0), "last_used": 0, "urls": []})
+            blob["last_used"] = max(blob["last_used"], entry.get("last_used", 0))
+            blob["urls"].append(url)
+
+        for path in self.blob_dir.glob("*.pdf"):
+            if path.stem not in blobs:
+                size = path.stat().st_size
+                path.unlink(missing_ok=True)
+                print(f"   Removed unreferenced cached PDF {path.stem[:12]} ({size / 1024 / 1024:.1f} MB)")
+
+        total = sum(b["size"] for b in blobs.values())
+        for sha256, blob in sorted(blobs.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if sha256 == keep:
+                continue
+            self.blob_path(sha256).unlink(missing_ok=True)
+            for url in blob["urls"]:
+                del self._index[url]
+            total -= blob["size"]
+            print(f"   Evicted cached PDF {sha256[:12]} ({blob['size'] / 1024 / 1024:.1f} MB)")
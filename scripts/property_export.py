@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Columnar Property Export
+Writes parsed properties to a Parquet dataset, Hive-partitioned by state,
+county and sale date, so cross-county analytics run locally on columnar files
+instead of paging through PostgREST:
+
+    exports/state=PA/county=Blair/sale_date=2026-09-18/<document_id>.parquet
+
+One file per document and sale date; re-parsing a document replaces its
+files. Rows are streamed to the file in record batches as they are parsed, and
+a file only appears once its document has been fully exported.
+
+Requires pyarrow (optional dependency; `pip install pyarrow`).
+
+Usage:
+    python universal_parser.py --county "Blair" --state "PA" --export-dir exports
+    python property_export.py exports                 # summary of the dataset
+    python property_export.py exports --duplicates 20
+
+    export = PropertyExport("exports", "PA", "Blair")
+    rows = export.store(document_id, iter_properties(...))
+"""
+
+import argparse
+import os
+import re
+import sys
+import uuid
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # Optional dependency - exports are unavailable without it
+    pa = None
+
+PROPERTY_EXPORT_DIR = os.getenv("PROPERTY_EXPORT_DIR")
+
+# Rows buffered per record batch before they are written
+EXPORT_BATCH_ROWS = 5000
+
+# Partition value used for rows without a sale date
+UNKNOWN_SALE_DATE = "unknown"
+
+if pa is not None:
+    PROPERTY_SCHEMA = pa.schema([
+        ("document_id", pa.string()),
+        ("parcel_id", pa.string()),
+        ("address", pa.string()),
+        ("owner", pa.string()),
+        ("city", pa.string()),
+        ("tax_amount", pa.float64()),
+        ("total_due", pa.float64()),
+        ("tax_year", pa.int32()),
+        ("sale_type", pa.string()),
+        ("confidence", pa.float64()),
+        ("raw_text", pa.string()),
+    ])
+    PARTITIONING = ds.partitioning(pa.schema([
+        ("state", pa.string()),
+        ("county", pa.string()),
+        ("sale_date", pa.string()),
+    ]), flavor="hive")
+
+
+def export_available() -> bool:
+    return pa is not None
+
+
+def partition_value(value: Optional[str]) -> str:
+    """Path-safe partition value ('Miami-Dade' stays, 'St. Lucie' -> 'St_Lucie')"""
+    return re.sub(r'[^A-Za-z0-9_-]+', '_', str(value)).strip('_') or UNKNOWN_SALE_DATE
+
+
+class PropertyExport:
+    """Parquet dataset of parsed properties for one county"""
+
+    def __init__(self, export_dir, state_code: str, county_name: str):
+        if pa is None:
+            raise ImportError("Columnar export requires pyarrow (pip install pyarrow)")
+        self.county_dir = (Path(export_dir) / f"state={partition_value(state_code.upper())}"
+                           / f"county={partition_value(county_name)}")
+
+    def path(self, document_id: str, sale_date: Optional[str]) -> Path:
+        sale_date = partition_value(sale_date) if sale_date else UNKNOWN_SALE_DATE
+        return self.county_dir / f"sale_date={sale_date}" / f"{partition_value(document_id)}.parquet"
+
+    def store(self, document_id: str, rows: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Pass rows through while writing them to the document's Parquet files.
+        Files are committed only if rows is fully consumed; a partial export
+        (error or early stop) leaves the previous files in place.
+        """
+        writers = {}  # sale_date -> (ParquetWriter, tmp path, buffered rows)
+        committed = False
+
+        try:
+            for row in rows:
+                sale_date = row.get('sale_date') or None
+                if sale_date not in writers:
+                    path = self.path(document_id, sale_date)
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+                    writers[sale_date] = (pq.ParquetWriter(tmp_path, PROPERTY_SCHEMA), tmp_path, [])
+
+                buffered = writers[sale_date][2]
+                buffered.append(export_row(document_id, row))
+                if len(buffered) >= EXPORT_BATCH_ROWS:
+                    write_batch(writers[sale_date][0], buffered)
+                yield row
+
+            for writer, _, buffered in writers.values():
+                write_batch(writer, buffered)
+                writer.close()
+            self.discard(document_id)
+            for sale_date, (_, tmp_path, _) in writers.items():
+                os.replace(tmp_path, self.path(document_id, sale_date))
+            committed = True
+        finally:
+            if not committed:
+                for writer, tmp_path, _ in writers.values():
+                    writer.close()
+                    tmp_path.unlink(missing_ok=True)
+
+    def discard(self, document_id: str) -> None:
+        """Remove a document's files from every sale date partition"""
+        for path in self.county_dir.glob(f"sale_date=*/{partition_value(document_id)}.parquet"):
+            path.unlink()
+
+
+def export_row(document_id: str, row: Dict) -> Dict:
+    exported = {name: row.get(name) for name in PROPERTY_SCHEMA.names}
+    exported['document_id'] = str(document_id)
+    return exported
+
+
+def write_batch(writer, rows: List[Dict]) -> None:
+    if rows:
+        writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=PROPERTY_SCHEMA))
+        rows.clear()
+
+
+# =============================================================================
+# ANALYTICS
+# =============================================================================
+
+def load_dataset(export_dir, columns: Optional[List[str]] = None, **partitions) -> "pa.Table":
+    """
+    Read the exported dataset (or the partitions matching e.g. state='PA',
+    county='Blair') as an Arrow table, partition columns included.
+    """
+    dataset = ds.dataset(str(export_dir), format="parquet", partitioning=PARTITIONING)
+    condition = None
+    for name, value in partitions.items():
+        term = ds.field(name) == partition_value(value)
+        condition = term if condition is None else condition & term
+    return dataset.to_table(columns=columns, filter=condition)
+
+
+def duplicate_parcels(table: "pa.Table") -> "pa.Table":
+    """Parcel IDs listed more than once within a state, most repeated first"""
+    counts = (table.filter(pc.is_valid(table['parcel_id']))
+              .group_by(['state', 'parcel_id'])
+              .aggregate([('parcel_id', 'count'), ('county', 'count_distinct'),
+                          ('document_id', 'count_distinct')]))
+    counts = counts.filter(pc.greater(counts['parcel_id_count'], 1))
+    return counts.sort_by([('parcel_id_count', 'descending'), ('parcel_id', 'ascending')])
+
+
+def total_due_distribution(table: "pa.Table") -> List[Dict]:
+    """Per-county count, sum, mean and quantiles of total_due"""
+    stats = []
+    for state, county in sorted(set(zip(table['state'].to_pylist(), table['county'].to_pylist()))):
+        mask = pc.and_(pc.equal(table['state'], state), pc.equal(table['county'], county))
+        total_due = pc.drop_null(table.filter(mask)['total_due'])
+        if len(total_due) == 0:
+            continue
+        quantiles = pc.quantile(total_due, q=[0.25, 0.5, 0.75, 0.95]).to_pylist()
+        stats.append({
+            'state': state,
+            'county': county,
+            'count': len(total_due),
+            'sum': pc.sum(total_due).as_py(),
+            'mean': pc.mean(total_due).as_py(),
+            'min': pc.min(total_due).as_py(),
+            'p25': quantiles[0],
+            'median': quantiles[1],
+            'p75': quantiles[2],
+            'p95': quantiles[3],
+            'max': pc.max(total_due).as_py(),
+        })
+    return stats
+
+
+def print_summary(export_dir, duplicates: int = 10) -> None:
+    table = load_dataset(export_dir, columns=['state', 'county', 'sale_date', 'document_id',
+                                              'parcel_id', 'total_due'])
+    print(f"Property export: {export_dir}")
+    print(f"   {table.num_rows} properties, {len(pc.unique(table['document_id']))} documents")
+
+    print("\ntotal_due by county:")
+    print(f"   {'County':<24} {'Count':>7} {'Sum':>14} {'Median':>10} {'P95':>10} {'Max':>10}")
+    for row in total_due_distribution(table):
+        print(f"   {row['state'] + '/' + row['county']:<24} {row['count']:>7} {row['sum']:>14,.2f} "
+              f"{row['median']:>10,.2f} {row['p95']:>10,.2f} {row['max']:>10,.2f}")
+
+    dupes = duplicate_parcels(table)
+    print(f"\nDuplicate parcel IDs: {dupes.num_rows}")
+    for row in dupes.slice(0, duplicates).to_pylist():
+        print(f"   {row['state']} {row['parcel_id']}: {row['parcel_id_count']} rows, "
+              f"{row['county_count_distinct']} counties, {row['document_id_count_distinct']} documents")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize an exported property dataset')
+    parser.add_argument('export_dir', nargs='?', default=PROPERTY_EXPORT_DIR,
+                        help='Dataset directory (default: $PROPERTY_EXPORT_DIR)')
+    parser.add_argument('--duplicates', type=int, default=10, help='Duplicate parcel IDs to list')
+    args = parser.parse_args()
+
+    if not export_available():
+        sys.exit("pyarrow is not installed (pip install pyarrow)")
+    if not args.export_dir:
+        parser.error('export_dir is required (or set PROPERTY_EXPORT_DIR)')
+
+    print_summary(args.export_dir, args.duplicates)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Bulk Property Store
+Stores parsed properties in Supabase in chunks via the upsert_properties_bulk RPC
+(sql/migrations/20261016_upsert_properties_bulk.sql) instead of one
+upsert_property round trip per parcel.
+
+Diff mode (store_property_diff) fetches the content hashes already stored for
+the county's sale list in one call (sql/migrations/20261016_property_content_hash.sql),
+sends only new and changed properties, and marks properties missing from the
+new list as withdrawn.
+
+Used by universal_parser.py (and through it the county parser plugins).
+"""
+
+import hashlib
+import json
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Properties sent per upsert_properties_bulk request
+DEFAULT_CHUNK_SIZE = 200
+
+# Withdrawals are skipped when a parse would withdraw more than this share of
+# the stored list; that is a truncated or failed parse, not a changed list
+MAX_WITHDRAW_SHARE = 0.5
+
+
+def build_property_payload(prop: Dict, default_tax_year: Optional[int] = None) -> Dict:
+    """Map a parsed property dict to the JSON shape upsert_properties_bulk expects"""
+    payload = {
+        'parcel_id': prop['parcel_id'],
+        'property_address': prop.get('address'),
+        'owner_name': prop.get('owner'),
+        'tax_amount': prop.get('tax_amount'),
+        'total_due': prop.get('total_due'),
+        'tax_year': prop.get('tax_year', default_tax_year),
+        'sale_type': prop.get('sale_type'),
+        'sale_date': prop.get('sale_date'),
+        'raw_text': prop.get('raw_text'),
+        'confidence': prop.get('confidence', 0.85),
+    }
+    payload['content_hash'] = content_hash(payload)
+    return payload
+
+
+def content_hash(payload: Dict) -> str:
+    """
+    Hash of the payload fields upsert_property actually writes, compared with
+    properties.content_hash in diff mode. Null fields are left out: the SQL
+    keeps the stored value for them (COALESCE), so a field dropping to null
+    isn't a change that could be written.
+    """
+    fields = {key: value for key, value in payload.items() if key != 'content_hash' and value is not None}
+    return hashlib.sha256(json.dumps(fields, sort_keys=True, default=str).encode()).hexdigest()[:32]
+
+
+def upsert_properties_bulk(supabase, county_id: str, document_id: str, payloads: List[Dict]) -> List[Dict]:
+    """
+    Upsert one chunk of property payloads in a single RPC.
+
+    Returns:
+        One dict per input row: row_index, parcel_id, property_id, error_message
+    """
+    result = supabase.rpc('upsert_properties_bulk', {
+        'p_county_id': county_id,
+        'p_document_id': document_id,
+        'p_properties': payloads
+    }).execute()
+    return result.data or []
+
+
+def store_properties(
+    supabase,
+    county_id: str,
+    document_id: str,
+    properties: Iterable[Dict],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    default_tax_year: Optional[int] = None
+) -> Tuple[int, int, float]:
+    """
+    Store properties in chunks of chunk_size, reporting failures per row.
+
+    properties may be any iterable (e.g. a streaming parser), so chunks are
+    sent as soon as they fill up.
+
+    Returns:
+        Tuple of (stored, failed, average confidence of stored rows)
+    """
+    chunk_size = max(1, chunk_size)
+    stored = 0
+    failed = 0
+    confidence_total = 0.0
+    chunk: List[Dict] = []
+
+    def flush() -> None:
+        nonlocal stored, failed, confidence_total
+        payloads = [build_property_payload(p, default_tax_year) for p in chunk]
+
+        try:
+            results = upsert_properties_bulk(supabase, county_id, document_id, payloads)
+        except Exception as e:
+            failed += len(chunk)
+            print(f"      Error storing chunk of {len(chunk)} properties: {e}")
+            return
+
+        errors = {r['row_index']: r.get('error_message') for r in results if r.get('error_message')}
+        returned = {r['row_index'] for r in results}
+
+        for i, payload in enumerate(payloads):
+            if i in errors or i not in returned:
+                failed += 1
+                print(f"      Error storing property {payload['parcel_id']}: {errors.get(i, 'no result returned')}")
+            else:
+                stored += 1
+                confidence_total += payload['confidence']
+
+        print(f"      Progress: {stored} stored, {failed} failed")
+
+    for prop in properties:
+        chunk.append(prop)
+        if len(chunk) >= chunk_size:
+            flush()
+            chunk = []
+
+    if chunk:
+        flush()
+
+    avg_confidence = confidence_total / stored if stored else 0
+    return stored, failed, avg_confidence
+
+
+# =============================================================================
+# DIFF MODE
+# =============================================================================
+
+class PropertyDiff:
+    """Classifies parsed properties against the content hashes stored for their list"""
+
+    def __init__(self, existing: Dict[Tuple[str, Optional[int]], Optional[str]]):
+        self.existing = existing
+        self.seen = set()
+        self.tax_years = set()
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.unchanged_confidence = 0.0
+        self.withdrawn = 0
+
+    def changed(self, properties: Iterable[Dict], default_tax_year: Optional[int] = None) -> Iterator[Dict]:
+        """Yield only new or changed properties, counting the unchanged ones"""
+        for prop in properties:
+            payload = build_property_payload(prop, default_tax_year)
+            key = (payload['parcel_id'], payload['tax_year'])
+            self.seen.add(key)
+            self.tax_years.add(payload['tax_year'])
+
+            if key not in self.existing:
+                self.inserted += 1
+                yield prop
+            elif self.existing[key] != payload['content_hash']:
+                self.updated += 1
+                yield prop
+            else:
+                self.unchanged += 1
+                self.unchanged_confidence += payload['confidence']
+
+    def removed(self) -> List[Tuple[str, Optional[int]]]:
+        """Stored properties of the parsed tax years that are no longer listed"""
+        return [key for key in self.existing if key[1] in self.tax_years and key not in self.seen]
+
+    def summary(self) -> str:
+        return (f"{self.inserted} new, {self.updated} changed, {self.unchanged} unchanged, "
+                f"{self.withdrawn} withdrawn")
+
+
+def fetch_content_hashes(supabase, county_id: str,
+                         sale_type: Optional[str]) -> Dict[Tuple[str, Optional[int]], Optional[str]]:
+    """(parcel_id, tax_year) -> content_hash for the county's listed properties of sale_type"""
+    result = supabase.rpc('get_property_content_hashes', {
+        'p_county_id': county_id,
+        'p_sale_type': sale_type
+    }).execute()
+    return {(row['parcel_id'], row['tax_year']): row['content_hash'] for row in result.data or []}
+
+
+def mark_withdrawn(supabase, county_id: str, sale_type: Optional[str], keys: List[Tuple[str, Optional[int]]],
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Mark (parcel_id, tax_year) properties as withdrawn, chunk_size per request"""
+    withdrawn = 0
+    chunk_size = max(1, chunk_size)
+    for start in range(0, len(keys), chunk_size):
+        result = supabase.rpc('mark_properties_withdrawn', {
+            'p_county_id': county_id,
+            'p_sale_type': sale_type,
+            'p_properties': [{'parcel_id': parcel_id, 'tax_year': tax_year}
+                             for parcel_id, tax_year in keys[start:start + chunk_size]]
+        }).execute()
+        withdrawn += result.data or 0
+    return withdrawn
+
+
+def store_property_diff(
+    supabase,
+    county_id: str,
+    document_id: str,
+    properties: Iterable[Dict],
+    sale_type: Optional[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    default_tax_year: Optional[int] = None,
+    withdraw_removed: bool = True
+) -> Tuple[int, int, float, PropertyDiff]:
+    """
+    Store only the properties that changed since the sale list was last stored.
+
+    Unchanged properties are counted as stored. With withdraw_removed,
+    stored properties missing from this parse are marked withdrawn (unless
+    that would withdraw more than MAX_WITHDRAW_SHARE of the list).
+
+    Returns:
+        Tuple of (stored, failed, average confidence, PropertyDiff)
+    """
+    diff = PropertyDiff(fetch_content_hashes(supabase, county_id, sale_type))
+    print(f"      Diff mode: {len(diff.existing)} properties stored for this list")
+
+    stored, failed, avg_confidence = store_properties(
+        supabase, county_id, document_id, diff.changed(properties, default_tax_year), chunk_size, default_tax_year
+    )
+
+    removed = diff.removed() if withdraw_removed and not failed else []
+    if removed and len(removed) > MAX_WITHDRAW_SHARE * len(diff.existing):
+        print(f"      Warning: {len(removed)} of {len(diff.existing)} stored properties missing from this parse, "
+              f"not withdrawing them")
+    elif removed:
+        diff.withdrawn = mark_withdrawn(supabase, county_id, sale_type, removed, chunk_size)
+
+    confidence_total = avg_confidence * stored + diff.unchanged_confidence
+    stored += diff.unchanged
+    return stored, failed, confidence_total / stored if stored else 0, diff
@@ -0,0 +1,93 @@
+"""
+Property Work Sets
+The properties a batch script still has to process, from one keyset-paginated
+RPC (get_property_work_set, sql/migrations/20261016_property_work_set.sql)
+instead of a county lookup, a property query, and then per-property
+coordinate and state lookups.
+
+Each row has property_id, created_at, parcel_id, property_address, city,
+owner_name, county_name, state_code, latitude, longitude, has_screenshot and
+has_regrid_data. Rows come newest first (created_at DESC, then property_id).
+
+Queues:
+- neighborhood: not yet in neighborhood_analysis (neighborhood_enrichment.py)
+- access: road access not yet analyzed (osm_access_analyzer.py)
+- screenshots, regrid, scraping: Regrid work (regrid_scraper.py)
+
+Usage:
+    from property_work_set import fetch_work_set
+    properties = fetch_work_set(SUPABASE_URL, SUPABASE_KEY, 'neighborhood', 'Blair', 'PA', limit=1000)
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+# Add scripts directory to path to import shared modules
+sys.path.insert(0, str(Path(__file__).parent))
+from http_client import http_request
+
+WORK_SET_QUEUES = ('neighborhood', 'access', 'screenshots', 'regrid', 'scraping')
+
+# Rows fetched per get_property_work_set call
+DEFAULT_PAGE_SIZE = 500
+
+
+def iter_work_set(
+    supabase_url: str,
+    supabase_key: str,
+    queue: str,
+    county_name: Optional[str] = None,
+    state_code: Optional[str] = None,
+    limit: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE
+) -> Iterator[Dict]:
+    """
+    Yield a queue's work set page by page (keyset on created_at DESC,
+    property_id), up to limit rows (None = all). Raises
+    requests.RequestException on failure.
+    """
+    if queue not in WORK_SET_QUEUES:
+        raise ValueError(f"Unknown work set queue: {queue}")
+
+    headers = {
+        "Authorization": f"Bearer {supabase_key}",
+        "apikey": supabase_key,
+        "Content-Type": "application/json",
+    }
+    rpc_url = f"{supabase_url}/rest/v1/rpc/get_property_work_set"
+
+    after_created_at = after_id = None
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+        response = http_request('POST', rpc_url, headers=headers, json={
+            'p_queue': queue,
+            'p_county_name': county_name,
+            'p_state_code': state_code,
+            'p_after_created_at': after_created_at,
+            'p_after_id': after_id,
+            'p_limit': size
+        })
+        response.raise_for_status()
+        page = response.json()
+
+        yield from page
+        if len(page) < size:
+            return
+        after_created_at, after_id = page[-1]['created_at'], page[-1]['property_id']
+        if remaining is not None:
+            remaining -= len(page)
+
+
+def fetch_work_set(
+    supabase_url: str,
+    supabase_key: str,
+    queue: str,
+    county_name: Optional[str] = None,
+    state_code: Optional[str] = None,
+    limit: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE
+) -> List[Dict]:
+    """A queue's work set as a list (see iter_work_set)"""
+    return list(iter_work_set(supabase_url, supabase_key, queue, county_name, state_code, limit, page_size))
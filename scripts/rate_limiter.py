@@ -0,0 +1,95 @@
+"""
+Per-Host Rate Limiting
+Concurrency caps and token-bucket request rates for the hosts the scripts
+call, so a concurrent batch runs as fast as each API allows and no faster.
+
+- Each host gets a HostLimit: at most `concurrency` requests in flight and
+  `rate` requests per second on average (bursts of up to `burst`)
+- Overpass is the strictest (a couple of slots per client IP); the Census
+  APIs and Supabase allow much more
+- Thread-safe: the limits hold across every thread sharing this module
+
+Applied to every request sent through http_client.http_request; retries
+and timeouts live there.
+
+Usage:
+    from rate_limiter import host_limiter
+    with host_limiter(OVERPASS_API_URL):
+        response = session.post(OVERPASS_API_URL, data={'data': query}, timeout=30)
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict
+from urllib.parse import urlparse
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    concurrency: int  # Requests in flight
+    rate: float       # Requests per second (sustained)
+    burst: int        # Requests allowed back to back
+
+
+HOST_LIMITS: Dict[str, HostLimit] = {
+    'overpass-api.de': HostLimit(concurrency=2, rate=1.0, burst=2),
+    'geocoding.geo.census.gov': HostLimit(concurrency=4, rate=5.0, burst=5),
+    'api.census.gov': HostLimit(concurrency=8, rate=10.0, burst=10),
+    'api.usa.gov': HostLimit(concurrency=2, rate=1.0, burst=2),
+    'oiiwlzobizftprqspbzt.supabase.co': HostLimit(concurrency=16, rate=50.0, burst=50),
+}
+DEFAULT_HOST_LIMIT = HostLimit(concurrency=4, rate=5.0, burst=5)
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is available"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class HostLimiter:
+    """Concurrency cap plus token bucket for one host"""
+
+    def __init__(self, limit: HostLimit):
+        self.limit = limit
+        self.slots = threading.BoundedSemaphore(limit.concurrency)
+        self.bucket = TokenBucket(limit.rate, limit.burst)
+
+    def __enter__(self):
+        self.slots.acquire()
+        self.bucket.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.slots.release()
+
+
+_limiters: Dict[str, HostLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def host_limiter(url: str) -> HostLimiter:
+    host = urlparse(url).hostname or ''
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = HostLimiter(HOST_LIMITS.get(host, DEFAULT_HOST_LIMIT))
+        return _limiters[host]
+
@@ -0,0 +1,128 @@
+-- ============================================================================
+-- Migration: Property Content Hashes (incremental diff mode)
+-- Date: 2026-10-16
+-- Purpose: Let the PDF parsers write only the properties that changed since
+--          the last parse of a sale list, instead of re-upserting every row.
+--
+-- properties.content_hash is a hash of the non-null fields a parser last sent
+-- for the row, i.e. what upsert_property wrote (computed client-side, see
+-- scripts/property_store.py). On a re-parse the
+-- parser fetches the hashes for the county's sale list in one call, sends only
+-- new and changed rows through upsert_properties_bulk, and marks rows missing
+-- from the new list as withdrawn.
+--
+-- Requires 20261016_upsert_properties_bulk.sql.
+-- Safe to run multiple times (idempotent)
+-- ============================================================================
+
+ALTER TABLE properties ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_properties_county_sale_type ON properties(county_id, sale_type);
+
+-- ============================================================================
+-- upsert_properties_bulk: also store content_hash, and bring withdrawn rows
+-- back when they reappear on a list
+-- ============================================================================
+CREATE OR REPLACE FUNCTION upsert_properties_bulk(
+  p_county_id UUID,
+  p_document_id UUID,
+  p_properties JSONB
+) RETURNS TABLE (
+  row_index INTEGER,
+  parcel_id TEXT,
+  property_id UUID,
+  error_message TEXT
+) AS $$
+DECLARE
+  v_row JSONB;
+  v_index INTEGER := 0;
+BEGIN
+  FOR v_row IN SELECT value FROM jsonb_array_elements(p_properties)
+  LOOP
+    row_index := v_index;
+    parcel_id := v_row->>'parcel_id';
+    property_id := NULL;
+    error_message := NULL;
+
+    BEGIN
+      property_id := upsert_property(
+        p_county_id,
+        p_document_id,
+        v_row->>'parcel_id',
+        v_row->>'property_address',
+        v_row->>'owner_name',
+        (v_row->>'tax_amount')::NUMERIC,
+        (v_row->>'total_due')::NUMERIC,
+        (v_row->>'tax_year')::INTEGER,
+        v_row->>'sale_type',
+        (v_row->>'sale_date')::TIMESTAMP,
+        v_row->>'raw_text',
+        COALESCE((v_row->>'confidence')::NUMERIC, 0.85)
+      );
+
+      UPDATE properties p
+      SET
+        content_hash = v_row->>'content_hash',
+        sale_status = CASE WHEN p.sale_status = 'withdrawn' THEN 'upcoming' ELSE p.sale_status END
+      WHERE p.id = property_id;
+    EXCEPTION WHEN OTHERS THEN
+      error_message := SQLERRM;
+    END;
+
+    RETURN NEXT;
+    v_index := v_index + 1;
+  END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- get_property_content_hashes: (parcel_id, tax_year, content_hash) for every
+-- listed (not withdrawn) property of a county's sale list.
+-- Returned as one JSONB array so PostgREST's row limit doesn't truncate it.
+-- ============================================================================
+CREATE OR REPLACE FUNCTION get_property_content_hashes(
+  p_county_id UUID,
+  p_sale_type TEXT DEFAULT NULL
+) RETURNS JSONB AS $$
+  SELECT COALESCE(jsonb_agg(jsonb_build_object(
+    'parcel_id', p.parcel_id,
+    'tax_year', p.tax_year,
+    'content_hash', p.content_hash
+  )), '[]'::JSONB)
+  FROM properties p
+  WHERE p.county_id = p_county_id
+    AND (p_sale_type IS NULL OR p.sale_type = p_sale_type)
+    AND p.sale_status IS DISTINCT FROM 'withdrawn';
+$$ LANGUAGE sql STABLE;
+
+-- ============================================================================
+-- mark_properties_withdrawn: set sale_status = 'withdrawn' for properties that
+-- are no longer on their sale list. p_properties is a JSON array of
+-- {"parcel_id": "...", "tax_year": 2026}. Returns the number of rows updated.
+-- ============================================================================
+CREATE OR REPLACE FUNCTION mark_properties_withdrawn(
+  p_county_id UUID,
+  p_sale_type TEXT,
+  p_properties JSONB
+) RETURNS INTEGER AS $$
+DECLARE
+  v_count INTEGER;
+BEGIN
+  UPDATE properties p
+  SET sale_status = 'withdrawn',
+      updated_at = NOW()
+  FROM jsonb_to_recordset(p_properties) AS r(parcel_id TEXT, tax_year INTEGER)
+  WHERE p.county_id = p_county_id
+    AND (p_sale_type IS NULL OR p.sale_type = p_sale_type)
+    AND p.parcel_id = r.parcel_id
+    AND p.tax_year IS NOT DISTINCT FROM r.tax_year
+    AND p.sale_status IS DISTINCT FROM 'withdrawn';
+
+  GET DIAGNOSTICS v_count = ROW_COUNT;
+  RETURN v_count;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON COLUMN properties.content_hash IS 'Hash of the non-null parser payload fields last stored for this row; unchanged rows are skipped on re-parse.';
+COMMENT ON FUNCTION get_property_content_hashes IS 'Returns a JSON array of {parcel_id, tax_year, content_hash} for a county sale list (withdrawn rows excluded).';
+COMMENT ON FUNCTION mark_properties_withdrawn IS 'Marks the given (parcel_id, tax_year) properties of a county sale list as withdrawn; returns the count updated.';
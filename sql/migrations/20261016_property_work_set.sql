@@ -0,0 +1,106 @@
+-- ============================================================================
+-- Migration: Property Work Sets
+-- Date: 2026-10-16
+-- Purpose: Give the batch scripts (neighborhood_enrichment.py,
+--          osm_access_analyzer.py, regrid_scraper.py) their work set in one
+--          call: the county is resolved by name in the query, and each row
+--          carries the state and coordinates the script needs, so there is no
+--          county lookup beforehand and no per-property lookup afterwards.
+--
+-- Queues (p_queue):
+--   neighborhood  no neighborhood_analysis row yet, coordinates known
+--   access        coordinates known, road access not analyzed yet
+--   screenshots   has_screenshot = false
+--   regrid        has_regrid_data = false
+--   scraping      no regrid_data row yet, auction_status = 'active'
+--
+-- Coordinates come from regrid_data, falling back to properties.
+-- Keyset pagination: rows are ordered newest first (created_at DESC, rows
+-- without created_at last, then property_id), the order the neighborhood and
+-- scraping queues always used (screenshots and regrid were previously ordered
+-- by parcel_id). Pass the last row's created_at and property_id as
+-- p_after_created_at / p_after_id to get the next page.
+--
+-- Requires sql/neighborhood_analysis_schema.sql, sql/supabase-regrid-schema.sql
+-- and migrations/add_auction_status.sql.
+-- Safe to run multiple times (idempotent)
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_properties_created_at_id ON properties(created_at DESC NULLS LAST, id);
+
+-- Earlier version paged by property_id only
+DROP FUNCTION IF EXISTS get_property_work_set(TEXT, TEXT, TEXT, UUID, INTEGER);
+
+CREATE OR REPLACE FUNCTION get_property_work_set(
+  p_queue TEXT,
+  p_county_name TEXT DEFAULT NULL,
+  p_state_code TEXT DEFAULT NULL,
+  p_after_created_at TIMESTAMP DEFAULT NULL,
+  p_after_id UUID DEFAULT NULL,
+  p_limit INTEGER DEFAULT 500
+) RETURNS TABLE (
+  property_id UUID,
+  created_at TIMESTAMP,
+  parcel_id TEXT,
+  property_address TEXT,
+  city TEXT,
+  owner_name TEXT,
+  county_name TEXT,
+  state_code TEXT,
+  latitude NUMERIC,
+  longitude NUMERIC,
+  has_screenshot BOOLEAN,
+  has_regrid_data BOOLEAN
+) AS $$
+BEGIN
+  IF p_queue NOT IN ('neighborhood', 'access', 'screenshots', 'regrid', 'scraping') THEN
+    RAISE EXCEPTION 'Unknown work set queue: %', p_queue;
+  END IF;
+
+  RETURN QUERY
+  SELECT
+    p.id,
+    p.created_at,
+    p.parcel_id,
+    p.property_address,
+    p.city,
+    p.owner_name,
+    c.county_name,
+    c.state_code,
+    COALESCE(rd.latitude, p.latitude)::NUMERIC,
+    COALESCE(rd.longitude, p.longitude)::NUMERIC,
+    p.has_screenshot,
+    p.has_regrid_data
+  FROM properties p
+  JOIN counties c ON c.id = p.county_id
+  LEFT JOIN regrid_data rd ON rd.property_id = p.id
+  LEFT JOIN neighborhood_analysis na ON na.property_id = p.id
+  WHERE
+    (p_county_name IS NULL OR c.county_name = p_county_name)
+    AND (p_state_code IS NULL OR c.state_code = p_state_code)
+    AND (p_after_id IS NULL
+         OR (p_after_created_at IS NULL AND p.created_at IS NULL AND p.id > p_after_id)
+         OR (p_after_created_at IS NOT NULL
+             AND (p.created_at IS NULL
+                  OR p.created_at < p_after_created_at
+                  OR (p.created_at = p_after_created_at AND p.id > p_after_id))))
+    AND CASE p_queue
+      WHEN 'neighborhood' THEN
+        na.id IS NULL
+        AND COALESCE(rd.latitude, p.latitude) IS NOT NULL
+        AND COALESCE(rd.longitude, p.longitude) IS NOT NULL
+      WHEN 'access' THEN
+        na.road_access_type IS NULL
+        AND rd.latitude IS NOT NULL
+        AND rd.longitude IS NOT NULL
+      WHEN 'screenshots' THEN p.has_screenshot = false
+      WHEN 'regrid' THEN p.has_regrid_data = false
+      WHEN 'scraping' THEN rd.id IS NULL AND p.auction_status = 'active'
+    END
+  ORDER BY p.created_at DESC NULLS LAST, p.id
+  LIMIT p_limit;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+COMMENT ON FUNCTION get_property_work_set(TEXT, TEXT, TEXT, TIMESTAMP, UUID, INTEGER) IS
+'One page of a batch work queue (neighborhood, access, screenshots, regrid, scraping) with county, state and coordinates, newest first, keyset-paginated by (created_at DESC, property_id) (p_after_created_at, p_after_id).';
@@ -0,0 +1,77 @@
+-- ============================================================================
+-- Migration: Bulk Neighborhood Analysis Upsert
+-- Date: 2026-10-16
+-- Purpose: Let neighborhood_enrichment.py and osm_access_analyzer.py store a
+--          batch of analyses per request instead of one
+--          upsert_neighborhood_analysis RPC round trip per property.
+--
+-- p_analyses is a JSON array of objects with the same fields as the
+-- upsert_neighborhood_analysis parameters (without the p_ prefix):
+--   [{"property_id": "...", "crime_statistics": {...}, "crime_data_source": "fbi_ucr",
+--     "landlocked_status": false, "road_access_type": "public_road",
+--     "distance_to_public_road_ft": 42.5, "neighborhood_score": 7.2, ...}, ...]
+-- Missing or null fields keep the stored value, as with the single-row function.
+--
+-- Each row runs in its own subtransaction, so one bad row does not abort the
+-- batch. One result row is returned per input row (row_index is 0-based) with
+-- either the analysis_id or the error message.
+--
+-- Requires sql/neighborhood_analysis_schema.sql.
+-- Safe to run multiple times (idempotent)
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION upsert_neighborhood_analysis_bulk(
+  p_analyses JSONB
+) RETURNS TABLE (
+  row_index INTEGER,
+  property_id UUID,
+  analysis_id UUID,
+  error_message TEXT
+) AS $$
+DECLARE
+  v_row JSONB;
+  v_index INTEGER := 0;
+BEGIN
+  FOR v_row IN SELECT value FROM jsonb_array_elements(p_analyses)
+  LOOP
+    row_index := v_index;
+    property_id := NULL;
+    analysis_id := NULL;
+    error_message := NULL;
+
+    BEGIN
+      property_id := (v_row->>'property_id')::UUID;
+      -- NULLIF: a JSON null must reach the function as SQL NULL
+      analysis_id := upsert_neighborhood_analysis(
+        property_id,
+        NULLIF(v_row->'crime_statistics', 'null'::JSONB),
+        v_row->>'crime_data_source',
+        NULLIF(v_row->'demographics', 'null'::JSONB),
+        v_row->>'demographics_source',
+        (v_row->>'landlocked_status')::BOOLEAN,
+        v_row->>'road_access_type',
+        (v_row->>'distance_to_public_road_ft')::NUMERIC,
+        v_row->>'access_notes',
+        NULLIF(v_row->'school_ratings', 'null'::JSONB),
+        v_row->>'school_data_source',
+        NULLIF(v_row->'amenity_distances', 'null'::JSONB),
+        v_row->>'amenity_data_source',
+        (v_row->>'neighborhood_score')::NUMERIC,
+        (v_row->>'safety_score')::NUMERIC,
+        (v_row->>'walkability_score')::NUMERIC,
+        (v_row->>'school_score')::NUMERIC,
+        (v_row->>'access_score')::NUMERIC,
+        (v_row->>'data_completeness')::NUMERIC,
+        (v_row->>'analysis_confidence')::NUMERIC
+      );
+    EXCEPTION WHEN OTHERS THEN
+      error_message := SQLERRM;
+    END;
+
+    RETURN NEXT;
+    v_index := v_index + 1;
+  END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION upsert_neighborhood_analysis_bulk IS 'Upserts a JSON array of neighborhood analyses via upsert_neighborhood_analysis, one subtransaction per row. Returns one row per input with the analysis_id or error_message.';
@@ -0,0 +1,66 @@
+-- ============================================================================
+-- Migration: Bulk Property Upsert
+-- Date: 2026-10-16
+-- Purpose: Let the PDF parsers store a chunk of properties per request instead
+--          of one upsert_property RPC round trip per parcel.
+--
+-- p_properties is a JSON array of objects with the same fields as the
+-- upsert_property parameters (without the p_ prefix):
+--   [{"parcel_id": "...", "property_address": "...", "owner_name": "...",
+--     "tax_amount": 0, "total_due": 0, "tax_year": 2026, "sale_type": "upset",
+--     "sale_date": "2026-09-18", "raw_text": "...", "confidence": 0.95}, ...]
+--
+-- Each row runs in its own subtransaction, so one bad row does not abort the
+-- chunk. One result row is returned per input row (row_index is 0-based) with
+-- either the property_id or the error message.
+--
+-- Safe to run multiple times (idempotent)
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION upsert_properties_bulk(
+  p_county_id UUID,
+  p_document_id UUID,
+  p_properties JSONB
+) RETURNS TABLE (
+  row_index INTEGER,
+  parcel_id TEXT,
+  property_id UUID,
+  error_message TEXT
+) AS $$
+DECLARE
+  v_row JSONB;
+  v_index INTEGER := 0;
+BEGIN
+  FOR v_row IN SELECT value FROM jsonb_array_elements(p_properties)
+  LOOP
+    row_index := v_index;
+    parcel_id := v_row->>'parcel_id';
+    property_id := NULL;
+    error_message := NULL;
+
+    BEGIN
+      property_id := upsert_property(
+        p_county_id,
+        p_document_id,
+        v_row->>'parcel_id',
+        v_row->>'property_address',
+        v_row->>'owner_name',
+        (v_row->>'tax_amount')::NUMERIC,
+        (v_row->>'total_due')::NUMERIC,
+        (v_row->>'tax_year')::INTEGER,
+        v_row->>'sale_type',
+        (v_row->>'sale_date')::TIMESTAMP,
+        v_row->>'raw_text',
+        COALESCE((v_row->>'confidence')::NUMERIC, 0.85)
+      );
+    EXCEPTION WHEN OTHERS THEN
+      error_message := SQLERRM;
+    END;
+
+    RETURN NEXT;
+    v_index := v_index + 1;
+  END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION upsert_properties_bulk IS 'Upserts a JSON array of parsed properties via upsert_property, one subtransaction per row. Returns one row per input with the property_id or error_message.';